@@ -0,0 +1,141 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#        for Blender 2.80         #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+bl_info = {
+    "name": "Alignment Tool",
+    "description": "Tool for aligning objects and profiles in Blender.",
+    "author": "Florian Otten",
+    "version": (0, 7),
+    "blender": (2, 82, 0),
+    "location": "3D View > Tools",
+    "warning": "",
+    "support": "COMMUNITY",
+    "wiki_url": "https://github.com/wefo-coding/blender-alignment-tool",
+    "tracker_url": "https://github.com/wefo-coding/blender-alignment-tool/issues/new",
+    "category": "Object"
+}
+
+
+# # # # # # # # # # # # # # # # # #
+#           Registration          #
+# # # # # # # # # # # # # # # # # #
+
+# Registering needs Blender, so the modules with the operators and panels
+# are imported by register() only. Everything else (the geometry and with
+# it NumPy) is imported on first use, see operators.py.
+
+def get_classes():
+    """
+    Returns the classes to register in order.
+    """
+    from .props import AlignPreset, AlignLink, AlignProps
+    from .operators import (
+        SetOrientationToObjectOperator,
+        SetOrientationToVerticesOperator,
+        AlignToOrientationOperator,
+        AlignToObjectOperator,
+        AlignCollectionsOperator,
+        AlignToVerticesOperator,
+        InstancesToVerticesOperator,
+        SetReferenceOperator,
+        AutoAlignOperator,
+        AlignToSurfaceOperator,
+        AlignToCurveOperator,
+        SavePresetOperator,
+        ApplyPresetOperator,
+        RemovePresetOperator,
+        AngleFromMeshOperator,
+        AngleFromCurveOperator,
+        SweepFromMeshOperator,
+        SweepFromCurveOperator,
+        CopyMeshToSelectedOperator,
+        BatchOperator,
+        DeduplicateMeshesOperator,
+        ExportStatsOperator,
+        ClearStatsOperator
+    )
+    from .panels import OrientationPanel, PresetPanel, AnglePanel, OtherPanel, StatsPanel
+    
+    return (
+        # Properties
+        AlignPreset,
+        AlignLink,
+        AlignProps,
+        
+        # Operators
+        SetOrientationToObjectOperator,
+        SetOrientationToVerticesOperator,
+        AlignToOrientationOperator,
+        AlignToObjectOperator,
+        AlignCollectionsOperator,
+        AlignToVerticesOperator,
+        InstancesToVerticesOperator,
+        SetReferenceOperator,
+        AutoAlignOperator,
+        AlignToSurfaceOperator,
+        AlignToCurveOperator,
+        SavePresetOperator,
+        ApplyPresetOperator,
+        RemovePresetOperator,
+        AngleFromMeshOperator,
+        AngleFromCurveOperator,
+        SweepFromMeshOperator,
+        SweepFromCurveOperator,
+        CopyMeshToSelectedOperator,
+        BatchOperator,
+        DeduplicateMeshesOperator,
+        ExportStatsOperator,
+        ClearStatsOperator,
+        
+        # Panels
+        OrientationPanel,
+        PresetPanel,
+        AnglePanel,
+        OtherPanel,
+        StatsPanel
+    )
+
+def register():
+    import bpy
+    from .props import AlignLink, AlignProps
+    from .handlers import cache_update, cache_load, cache_undo
+    from .selection import select_history_update
+    
+    # Register classes
+    for c in get_classes():
+        bpy.utils.register_class(c)
+    
+    # Set Properties
+    bpy.types.Scene.align = bpy.props.PointerProperty(type = AlignProps)
+    bpy.types.Object.align_live = bpy.props.PointerProperty(type = AlignLink)
+    
+    # Add handlers
+    bpy.app.handlers.depsgraph_update_post.append(cache_update)
+    bpy.app.handlers.depsgraph_update_post.append(select_history_update)
+    bpy.app.handlers.load_post.append(cache_load)
+    bpy.app.handlers.undo_post.append(cache_undo)
+    bpy.app.handlers.redo_post.append(cache_undo)
+
+def unregister():
+    import bpy
+    from .handlers import cache_update, cache_load, cache_undo
+    from .selection import select_history_update
+    
+    # Remove handlers
+    bpy.app.handlers.depsgraph_update_post.remove(cache_update)
+    bpy.app.handlers.depsgraph_update_post.remove(select_history_update)
+    bpy.app.handlers.load_post.remove(cache_load)
+    bpy.app.handlers.undo_post.remove(cache_undo)
+    bpy.app.handlers.redo_post.remove(cache_undo)
+    cache_load()
+    
+    # Delete Properties
+    del bpy.types.Scene.align
+    del bpy.types.Object.align_live
+    
+    # Unregister classes
+    for c in reversed(get_classes()):
+        bpy.utils.unregister_class(c)
@@ -0,0 +1,219 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#              Batch              #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Batch sessions: many align and angle jobs in one mode and one undo step.
+
+A job is a dict (e.g. loaded from JSON) with a "type" and the names of the
+objects, for example
+
+    {"type": "align_to_vertices", "objects": ["A", "B"], "target": "Frame",
+     "triples": [[0, 1, 2], [3, 4, 5]], "inverse": false, "move": true}
+
+See JOBS for all types. Scripts use session() and run_jobs(), users the
+operator align.batch with the jobs in a text datablock.
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import bpy
+import numpy as np
+from contextlib import contextmanager
+from . import geometry
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+@contextmanager
+def session(context=None, message="Alignment Tool batch", undo=True):
+    """
+    Runs the enclosed jobs in object mode and as a single undo step.
+
+    The mode of the active object is switched once for the whole session
+    instead of once per job. Generated meshes without users are reused and
+    the unused ones removed at the end. Inside an operator (which pushes its
+    own undo step) undo has to be False.
+    """
+    context = context or bpy.context
+    active = context.view_layer.objects.active
+    mode = active.mode if active is not None else 'OBJECT'
+    if(mode != 'OBJECT'):
+        bpy.ops.object.mode_set(mode='OBJECT')
+    geometry.release_orphans()
+    try:
+        yield
+    finally:
+        geometry.clear_mesh_pool()
+        if(mode != 'OBJECT' and context.view_layer.objects.active == active):
+            bpy.ops.object.mode_set(mode=mode)
+        if(undo):
+            bpy.ops.ed.undo_push(message=message)
+
+
+def get_objects(names):
+    """
+    Returns the objects with the given names or raises a ValueError.
+    """
+    if(isinstance(names, str) or not isinstance(names, (list, tuple))):
+        raise TypeError("Objects must be a list of names.")
+    objects = []
+    for name in names:
+        obj = bpy.data.objects.get(name) if isinstance(name, str) else None
+        if(obj is None):
+            raise ValueError("Object '" + str(name) + "' not found.")
+        objects.append(obj)
+    return objects
+
+
+def get_target(job, mesh=False):
+    """
+    Returns the target object of the job (a mesh object if mesh is True).
+    """
+    target, = get_objects([job['target']])
+    if(mesh and target.type != 'MESH'):
+        raise ValueError("Target '" + target.name + "' is no mesh.")
+    return target
+
+
+def get_triples(job, target, count=None):
+    """
+    Returns the vertex triples of the job as an (K, 3) array after checking
+    that there are count triples (if given) and that the vertices exist.
+    """
+    triples = np.asarray(job['triples'])
+    if(triples.ndim != 2 or triples.shape[1:] != (3,) or not np.issubdtype(triples.dtype, np.integer)):
+        raise TypeError("Triples must be a list of three vertex indices each.")
+    if(count is not None and len(triples) != count):
+        raise ValueError("%d triples for %d objects." % (len(triples), count))
+    if(len(triples) == 0):
+        raise ValueError("No triples given.")
+    if(triples.min() < 0 or triples.max() >= len(target.data.vertices)):
+        raise IndexError("The vertices do not exist in '" + target.name + "'.")
+    return triples
+
+
+def job_align_to_vertices(job):
+    target = get_target(job, True)
+    objects = get_objects(job['objects'])
+    geometry.align_to_vertices(
+        objects,
+        target,
+        get_triples(job, target, len(objects)),
+        job.get('inverse', False),
+        job.get('move', True)
+    )
+
+
+def job_instances_to_vertices(job):
+    target = get_target(job, True)
+    coords = geometry.world_coordinates(target, get_triples(job, target))
+    matrices, centers = geometry.vertex_frames(coords, job.get('inverse', False))
+    carrier = geometry.write_instances(job.get('carrier', "Align Instances"), matrices, centers)
+    if(type(carrier) is not bpy.types.Object):
+        return carrier
+
+
+def job_align_to_object(job):
+    target = get_target(job)
+    geometry.align_to_object(get_objects(job['objects']), target, job.get('move', True))
+
+
+def job_align_collections(job):
+    source = bpy.data.collections.get(job['source'])
+    target = bpy.data.collections.get(job['target'])
+    if(source is None or target is None):
+        return "Collection '" + (job['target'] if source else job['source']) + "' not found."
+    count, missing = geometry.align_pairs(
+        sorted(source.all_objects, key = lambda o: o.name),
+        sorted(target.all_objects, key = lambda o: o.name),
+        job.get('property'),
+        job.get('move', True)
+    )
+    if(missing):
+        return "No target for: " + ", ".join(missing)
+
+
+def job_align_to_surface(job):
+    target = get_target(job, True)
+    geometry.align_to_surface(get_objects(job['objects']), target, job.get('move', True))
+
+
+def job_align_to_curve(job):
+    target = get_target(job)
+    if(target.type != 'CURVE'):
+        return "Target '" + target.name + "' is no curve."
+    return geometry.align_to_curve(
+        get_objects(job['objects']),
+        target,
+        job.get('move', 0.0),
+        job.get('spacing', 0.0)
+    )
+
+
+def job_apply_preset(job):
+    preset = bpy.context.scene.align.presets.get(job['preset'])
+    if(preset is None):
+        return "Preset '" + job['preset'] + "' not found."
+    geometry.apply_preset(get_objects(job['objects']), preset, job.get('move', True))
+
+
+def job_angle(job, add_angle, profiles):
+    target = get_target(job, True)
+    profile = profiles.get(job['profile'])
+    if(profile is None):
+        return "Profile '" + job['profile'] + "' not found."
+    triple = job.get('triple')
+    if(triple is not None):
+        triple = [int(i) for i in get_triples({'triples': [triple]}, target, 1)[0]]
+    result = add_angle(target, profile, job.get('linked', True), triple)
+    if(type(result) is not bpy.types.Object):
+        return result
+
+
+# Job functions by type, each returns an error message or None
+JOBS = {
+    'align_to_vertices': job_align_to_vertices,
+    'instances_to_vertices': job_instances_to_vertices,
+    'align_to_object': job_align_to_object,
+    'align_collections': job_align_collections,
+    'align_to_surface': job_align_to_surface,
+    'align_to_curve': job_align_to_curve,
+    'apply_preset': job_apply_preset,
+    'angle_from_mesh': lambda job: job_angle(job, geometry.add_angle_from_mesh, bpy.data.meshes),
+    'angle_from_curve': lambda job: job_angle(job, geometry.add_angle_from_curve, bpy.data.curves)
+}
+
+
+def run_jobs(jobs):
+    """
+    Runs all jobs in order and returns the error messages.
+
+    A failing job does not stop the batch. Call it inside session() to get
+    one mode switch and one undo step.
+    """
+    if(not isinstance(jobs, list)):
+        return ["The jobs must be a list."]
+    msgs = []
+    for number, job in enumerate(jobs, 1):
+        try:
+            if(not isinstance(job, dict)):
+                raise TypeError("A job must be an object with a type.")
+            function = JOBS.get(job.get('type'))
+            if(function is None):
+                msg = "Unknown type '" + str(job.get('type')) + "'."
+            else:
+                msg = function(job)
+        except KeyError as error:
+            msg = "Missing '" + str(error.args[0]) + "'."
+        except (IndexError, TypeError, ValueError) as error:
+            msg = str(error)
+        if(msg):
+            msgs.append("Job " + str(number) + ": " + msg)
+    return msgs
@@ -0,0 +1,277 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#               CLI               #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Generates mitred angles without Blender.
+
+The profile is read from an OBJ file or from a NumPy .npz file with the
+arrays coords (V, 3), faces (flat vertex indices), sizes (vertices per face)
+and edges (E, 2). The jobs are angles in degrees (--angle) or a JSON file
+(--jobs) with a list of angles in degrees or objects with either an "angle"
+or a "triple" (start, center and end vertex of the corner in global
+coordinates) and an optional "name". Angles from a triple are placed at the
+corner like the add-on does.
+
+The angles are generated by a pool of processes and written as one OBJ or
+PLY file per angle or as one combined .npz file.
+
+Example:
+    python -m alignment_tool.cli profile.obj --angle 90 45 --output joints
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sys
+import numpy as np
+from .core import orientation_matrices, leg_angles, mitre_geometry
+
+# # # # # # # # # # # # # # # # # #
+#             Reading             #
+# # # # # # # # # # # # # # # # # #
+
+def read_obj(path):
+    """
+    Reads the vertices, faces and line edges of an OBJ file.
+    """
+    coords = []
+    faces = []
+    edges = []
+    with open(path) as file:
+        for line in file:
+            values = line.split()
+            if(not values):
+                continue
+            if(values[0] == 'v'):
+                coords.append([float(v) for v in values[1:4]])
+            elif(values[0] in ('f', 'l')):
+                # OBJ indices start at 1, negative indices are relative
+                indices = [int(v.split('/')[0]) for v in values[1:]]
+                indices = [i - 1 if i > 0 else len(coords) + i for i in indices]
+                if(values[0] == 'f'):
+                    faces.append(indices)
+                else:
+                    edges.extend(zip(indices, indices[1:]))
+    return (
+        np.array(coords, dtype=np.float64).reshape(-1, 3),
+        faces,
+        np.array(edges, dtype=np.int64).reshape(-1, 2)
+    )
+
+
+def read_npz(path):
+    """
+    Reads the vertices, faces and edges of a .npz file.
+    """
+    data = np.load(path)
+    coords = data['coords'].reshape(-1, 3)
+    faces = []
+    if('faces' in data):
+        sizes = data['sizes'] if 'sizes' in data else np.full(len(data['faces']) // 3, 3)
+        faces = np.split(data['faces'], np.cumsum(sizes)[:-1]) if len(sizes) else []
+    edges = data['edges'] if 'edges' in data else np.empty((0, 2), dtype=np.int64)
+    return coords, faces, edges.reshape(-1, 2)
+
+
+def read_profile(path):
+    """
+    Reads a profile from an OBJ or a .npz file.
+    """
+    if(path.lower().endswith('.npz')):
+        return read_npz(path)
+    return read_obj(path)
+
+
+# Smallest angle (and distance to a straight angle) like add_angle of the add-on
+MIN_ANGLE = math.radians(0.01)
+
+
+def job_angle(job):
+    """
+    Returns the angle of the job in radians or raises a ValueError if it is
+    no corner (not finite, near 0 or 180 degrees or above).
+    """
+    if(job['triple'] is None):
+        angle = math.radians(float(job['angle']))
+    else:
+        triple = np.asarray(job['triple'], dtype=np.float64)
+        if(triple.shape != (3, 3) or not np.all(np.isfinite(triple))):
+            raise ValueError("the triple must be 3 vertices with 3 coordinates")
+        with np.errstate(divide='ignore', invalid='ignore'):
+            angle = float(leg_angles(triple)[0])
+    if(not math.isfinite(angle) or angle < MIN_ANGLE or angle > math.pi - MIN_ANGLE):
+        raise ValueError("no corner (the angle must be between 0 and 180 degrees)")
+    return angle
+
+
+def read_jobs(args):
+    """
+    Returns the jobs as list of dicts with "name", "angle" and "triple".
+
+    Jobs that are no corner are reported with their name and skipped.
+    """
+    jobs = [{'angle': a} for a in args.angle or []]
+    if(args.jobs):
+        with open(args.jobs) as file:
+            jobs += [j if isinstance(j, dict) else {'angle': j} for j in json.load(file)]
+    valid = []
+    for i, job in enumerate(jobs):
+        job.setdefault('name', 'joint_%06d' % i)
+        job.setdefault('triple', None)
+        try:
+            job['angle'] = job_angle(job)
+        except KeyError:
+            print('%s: skipped, no angle or triple' % job['name'], file=sys.stderr)
+            continue
+        except (TypeError, ValueError) as error:
+            print('%s: skipped, %s' % (job['name'], error), file=sys.stderr)
+            continue
+        valid.append(job)
+    return valid
+
+# # # # # # # # # # # # # # # # # #
+#             Writing             #
+# # # # # # # # # # # # # # # # # #
+
+def write_obj(path, name, vertices, faces):
+    """
+    Writes an angle as OBJ file.
+    """
+    with open(path, 'w') as file:
+        file.write('o %s\n' % name)
+        file.write(''.join('v %.6f %.6f %.6f\n' % tuple(v) for v in vertices))
+        file.write(''.join('f %s\n' % ' '.join(str(i + 1) for i in f) for f in faces))
+
+
+def write_ply(path, name, vertices, faces):
+    """
+    Writes an angle as binary PLY file.
+    """
+    header = (
+        'ply\n'
+        'format binary_little_endian 1.0\n'
+        'comment %s\n'
+        'element vertex %d\n'
+        'property float x\n'
+        'property float y\n'
+        'property float z\n'
+        'element face %d\n'
+        'property list uchar int vertex_indices\n'
+        'end_header\n'
+    ) % (name, len(vertices), len(faces))
+    with open(path, 'wb') as file:
+        file.write(header.encode('ascii'))
+        file.write(np.asarray(vertices, dtype='<f4').tobytes())
+        for face in faces:
+            file.write(np.uint8(len(face)).tobytes())
+            file.write(np.asarray(face, dtype='<i4').tobytes())
+
+
+writers = {
+    'obj': write_obj,
+    'ply': write_ply
+}
+
+# # # # # # # # # # # # # # # # # #
+#             Workers             #
+# # # # # # # # # # # # # # # # # #
+
+# Profile and output settings of the worker process
+worker = {}
+
+
+def init_worker(profile, output, format):
+    """
+    Stores the profile once per process instead of once per job.
+    """
+    worker['profile'] = profile
+    worker['output'] = output
+    worker['format'] = format
+
+
+def build_joint(job):
+    """
+    Generates one angle. Single files are written by the worker itself, for
+    the combined file the geometry is returned to the main process.
+    """
+    vertices, faces = mitre_geometry(*worker['profile'], job['angle'])
+    if(job['triple'] is not None):
+        triple = np.asarray(job['triple'], dtype=np.float64)
+        matrix = orientation_matrices(triple)[0]
+        vertices = vertices @ matrix.T + triple[1]
+    if(worker['format'] in writers):
+        path = os.path.join(worker['output'], job['name'] + '.' + worker['format'])
+        writers[worker['format']](path, job['name'], vertices, faces)
+        return job['name'], len(vertices), len(faces)
+    return job['name'], vertices, faces
+
+
+def run(args):
+    profile = read_profile(args.profile)
+    jobs = read_jobs(args)
+    if(args.format in writers):
+        os.makedirs(args.output, exist_ok=True)
+
+    chunksize = max(1, len(jobs) // ((args.processes or os.cpu_count() or 1) * 4))
+    with multiprocessing.Pool(
+        args.processes,
+        initializer=init_worker,
+        initargs=(profile, args.output, args.format)
+    ) as pool:
+        results = pool.imap(build_joint, jobs, chunksize)
+        if(args.format in writers):
+            for name, vertex_count, face_count in results:
+                if(args.verbose):
+                    print('%s: %d vertices, %d faces' % (name, vertex_count, face_count))
+            return
+
+        # Combine all angles in one binary file
+        names, vertices, sizes, faces, vertex_counts, face_counts = [], [], [], [], [], []
+        for name, joint_vertices, joint_faces in results:
+            names.append(name)
+            vertices.append(joint_vertices)
+            vertex_counts.append(len(joint_vertices))
+            face_counts.append(len(joint_faces))
+            sizes.extend(len(f) for f in joint_faces)
+            faces.extend(joint_faces)
+
+    np.savez(
+        args.output,
+        names = np.array(names),
+        vertices = np.concatenate(vertices) if vertices else np.empty((0, 3)),
+        faces = np.concatenate(faces).astype(np.int64) if faces else np.empty(0, dtype=np.int64),
+        sizes = np.array(sizes, dtype=np.int64),
+        vertex_counts = np.array(vertex_counts, dtype=np.int64),
+        face_counts = np.array(face_counts, dtype=np.int64)
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description = "Generate mitred angles from a profile without Blender."
+    )
+    parser.add_argument("profile", help = "profile as .obj or .npz file")
+    parser.add_argument("--angle", type = float, nargs = '+', help = "angles between both legs in degrees")
+    parser.add_argument("--jobs", help = "JSON file with a list of angles or corners")
+    parser.add_argument("--output", default = "joints", help = "output directory (obj, ply) or file (npz)")
+    parser.add_argument("--format", choices = ('obj', 'ply', 'npz'), default = 'obj', help = "output format")
+    parser.add_argument("--processes", type = int, default = None, help = "number of processes (default: all cores)")
+    parser.add_argument("--verbose", action = 'store_true', help = "print every generated angle")
+    args = parser.parse_args(argv)
+    if(not args.angle and not args.jobs):
+        parser.error("no angles given, use --angle or --jobs")
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
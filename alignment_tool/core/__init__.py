@@ -0,0 +1,18 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#               Core              #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Geometry of the Alignment Tool without any dependency on Blender.
+
+Only NumPy is needed, so the core can be used by the add-on as well as by
+batch tools and benchmarks running without Blender.
+"""
+
+from .frames import orientation_matrices, leg_angles, normal_frames, plane_frame, matrix_eulers
+from .curves import bezier_polyline, arc_length_table, path_frames
+from .mitre import mitre_geometry, polyline_profile
+from .sweep import edge_chain, transport_frames, sweep_geometry
+from .hashing import triple_signatures, triple_index, find_triples
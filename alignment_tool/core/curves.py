@@ -0,0 +1,95 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#           Core: Curves          #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Tessellation and arc-length tables of curves (NumPy only).
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import numpy as np
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+def bezier_polyline(co, handle_left, handle_right, resolution, cyclic=False):
+    """
+    Tessellates a bezier spline into a polyline.
+
+    co, handle_left and handle_right are arrays of shape (P, 3) with the
+    control points and their handles. Every segment is evaluated at
+    resolution points like Blender does. Returns an array of shape (M, 3).
+    """
+    co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+    handle_left = np.asarray(handle_left, dtype=np.float64).reshape(-1, 3)
+    handle_right = np.asarray(handle_right, dtype=np.float64).reshape(-1, 3)
+    if(cyclic):
+        co = np.concatenate((co, co[:1]))
+        handle_left = np.concatenate((handle_left, handle_left[:1]))
+    if(len(co) < 2):
+        return co
+
+    # Evaluate all segments at once (segments, resolution, 3)
+    t = (np.arange(resolution) / resolution)[None, :, None]
+    p0, h0 = co[:-1, None], handle_right[:len(co) - 1, None]
+    h1, p1 = handle_left[1:, None], co[1:, None]
+    points = (
+        (1 - t) ** 3 * p0 +
+        3 * (1 - t) ** 2 * t * h0 +
+        3 * (1 - t) * t ** 2 * h1 +
+        t ** 3 * p1
+    )
+    return np.concatenate((points.reshape(-1, 3), co[-1:]))
+
+
+def arc_length_table(points):
+    """
+    Builds the arc-length table of a polyline.
+
+    Consecutive duplicate points are removed. Returns the remaining points as
+    an array of shape (M, 3) and the cumulative length at every point.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    segments = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    keep = np.concatenate(([True], segments > 0))
+    return points[keep], np.concatenate(([0.0], np.cumsum(segments[segments > 0])))
+
+
+def path_frames(points, lengths, distances, up=(0, 0, 1), cyclic=False):
+    """
+    Calculates the frames at the given distances along a polyline at once.
+
+    points and lengths are an arc-length table (see arc_length_table). The
+    segment of every distance is found by binary search. Distances beyond the
+    ends are clamped or, if cyclic, wrapped around. The Z-axis of each frame
+    follows the tangent and the X-axis is perpendicular to up. Returns the
+    positions (N, 3) and the orientation matrices (N, 3, 3).
+    """
+    distances = np.asarray(distances, dtype=np.float64).reshape(-1)
+    total = lengths[-1]
+    if(cyclic and total > 0):
+        distances = np.mod(distances, total)
+    else:
+        distances = np.clip(distances, 0, total)
+
+    # Find the segments and interpolate the positions
+    index = np.clip(np.searchsorted(lengths, distances, side='right') - 1, 0, len(points) - 2)
+    segment = points[index + 1] - points[index]
+    t = (distances - lengths[index]) / (lengths[index + 1] - lengths[index])
+    positions = points[index] + segment * t[:, None]
+
+    # Build the frames, use the Y-axis as up vector where up is tangent
+    vector_z = segment / np.linalg.norm(segment, axis=1, keepdims=True)
+    vector_x = np.cross(np.asarray(up, dtype=np.float64), vector_z)
+    parallel = np.linalg.norm(vector_x, axis=1) < 1e-9
+    vector_x[parallel] = np.cross([0.0, 1.0, 0.0], vector_z[parallel])
+    vector_x /= np.linalg.norm(vector_x, axis=1, keepdims=True)
+    vector_y = np.cross(vector_z, vector_x)
+    return positions, np.stack((vector_x, vector_y, vector_z), axis=2)
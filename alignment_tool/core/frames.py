@@ -0,0 +1,155 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#           Core: Frames          #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Orientation frames of vertex triples and normals (NumPy only).
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import numpy as np
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+def orientation_matrices(triples, inverse=False):
+    """
+    Calculates the orientation matrices of N vertex triples at once.
+
+    triples is an array of shape (N, 3, 3) holding the global coordinates of
+    the start, center and end vertex of every triple. inverse is a bool or an
+    array of N bools and swaps start and end per row. Returns an array of
+    shape (N, 3, 3) whose columns are the normalized X-, Y- and Z-axis.
+    """
+    triples = np.asarray(triples, dtype=np.float64).reshape(-1, 3, 3)
+    inverse = np.broadcast_to(np.asarray(inverse, dtype=bool), triples.shape[:1])
+
+    # Get vertices
+    coord_start = np.where(inverse[:, None], triples[:, 2], triples[:, 0])
+    coord_center = triples[:, 1]
+    coord_end = np.where(inverse[:, None], triples[:, 0], triples[:, 2])
+
+    # coord_center to coord_end is the Z-Axis, the Y-Axis is perpendicular
+    # to the plane of the triple and the X-Axis is perpendicular to both
+    vector_z = coord_end - coord_center
+    vector_y = np.cross(coord_start - coord_center, vector_z)
+    vector_x = np.cross(vector_y, vector_z)
+
+    # Build matrices (axes as columns) and normalize them like
+    # Vector.normalize() does, which leaves zero vectors untouched
+    matrices = np.stack((vector_x, vector_y, vector_z), axis=2)
+    norms = np.linalg.norm(matrices, axis=1, keepdims=True)
+    return matrices / np.where(norms == 0, 1, norms)
+
+
+def leg_angles(triples):
+    """
+    Calculates the angles between both legs of N vertex triples at once.
+
+    triples is an array of shape (N, 3, 3) with the start, center and end
+    vertex of every corner. Returns an array of N angles in radians.
+    """
+    triples = np.asarray(triples, dtype=np.float64).reshape(-1, 3, 3)
+    leg_a = triples[:, 2] - triples[:, 1]
+    leg_b = triples[:, 0] - triples[:, 1]
+    cos = np.einsum('ij,ij->i', leg_a, leg_b) / (
+        np.linalg.norm(leg_a, axis=1) * np.linalg.norm(leg_b, axis=1)
+    )
+    return np.arccos(np.clip(cos, -1, 1))
+
+
+def normal_frames(normals, reference):
+    """
+    Calculates N orientation matrices whose Z-axis is the given normal.
+
+    The X-axis is the reference axis (e.g. the current X-axis of an object)
+    projected onto the plane of the normal, so the objects keep their twist.
+    Where the reference is parallel to the normal, another axis is used.
+    Returns an array of shape (N, 3, 3) with the axes as columns.
+    """
+    normals = np.asarray(normals, dtype=np.float64).reshape(-1, 3)
+    reference = np.broadcast_to(np.asarray(reference, dtype=np.float64), normals.shape)
+    vector_z = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+    vector_x = reference - np.einsum('ij,ij->i', reference, vector_z)[:, None] * vector_z
+    parallel = np.linalg.norm(vector_x, axis=1) < 1e-9
+    vector_x[parallel] = np.cross([0.0, 1.0, 0.0], vector_z[parallel])
+    parallel = np.linalg.norm(vector_x, axis=1) < 1e-9
+    vector_x[parallel] = np.cross([1.0, 0.0, 0.0], vector_z[parallel])
+    vector_x /= np.linalg.norm(vector_x, axis=1, keepdims=True)
+    vector_y = np.cross(vector_z, vector_x)
+    return np.stack((vector_x, vector_y, vector_z), axis=2)
+
+
+def plane_frame(chunks, reference=None, inverse=False):
+    """
+    Fits a least-squares plane to any number of points given in chunks.
+
+    chunks is an iterable of arrays of shape (M, 3). Only the count, the sum
+    and the sum of the outer products are accumulated (relative to the first
+    point to avoid cancellation), so the memory does not grow with the number
+    of points. Like a vertex triple, the Y-axis of the frame is the normal of
+    the plane and the Z-axis the main direction of the points. The normal
+    points along reference (e.g. the sum of the vertex normals) if given,
+    inverse flips the Z-axis. Returns the center (3,) and the matrix (3, 3)
+    with the axes as columns, or None for less than three points.
+    """
+    count = 0
+    shift = None
+    total = np.zeros(3)
+    outer = np.zeros((3, 3))
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=np.float64).reshape(-1, 3)
+        if(len(chunk) == 0):
+            continue
+        if(shift is None):
+            shift = chunk[0].copy()
+        chunk = chunk - shift
+        count += len(chunk)
+        total += chunk.sum(axis=0)
+        outer += chunk.T @ chunk
+    if(count < 3):
+        return None
+
+    # Eigenvectors of the covariance in ascending order of the eigenvalues
+    mean = total / count
+    covariance = outer / count - np.outer(mean, mean)
+    values, vectors = np.linalg.eigh(covariance)
+    vector_y = vectors[:, 0]
+    vector_z = vectors[:, 2]
+
+    # Make the signs deterministic
+    if(reference is not None and np.dot(reference, vector_y) < 0):
+        vector_y = -vector_y
+    if(vector_z[np.argmax(np.abs(vector_z))] < 0):
+        vector_z = -vector_z
+    if(inverse):
+        vector_z = -vector_z
+    vector_x = np.cross(vector_y, vector_z)
+    return shift + mean, np.stack((vector_x, vector_y, vector_z), axis=1)
+
+
+def matrix_eulers(matrices):
+    """
+    Converts N rotation matrices (N, 3, 3) to XYZ Euler angles (N, 3).
+
+    Like Matrix.to_euler('XYZ'), the rotation is Z * Y * X. In the gimbal
+    lock (Y-angle of +-90 degrees) the Z-angle is set to 0.
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 3, 3)
+    cos_y = np.hypot(matrices[:, 0, 0], matrices[:, 1, 0])
+    locked = cos_y < 1e-9
+    angle_x = np.where(
+        locked,
+        np.arctan2(-matrices[:, 1, 2], matrices[:, 1, 1]),
+        np.arctan2(matrices[:, 2, 1], matrices[:, 2, 2])
+    )
+    angle_y = np.arctan2(-matrices[:, 2, 0], cos_y)
+    angle_z = np.where(locked, 0.0, np.arctan2(matrices[:, 1, 0], matrices[:, 0, 0]))
+    return np.column_stack((angle_x, angle_y, angle_z))
@@ -0,0 +1,132 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#          Core: Hashing          #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Geometric hashing of vertex triples to find alignment triples (NumPy only).
+
+A triple (start, center, end) is described by a signature that does not
+change when it is moved or rotated: the lengths center-start, center-end and
+the angle between both. All triples of a mesh whose start and end are edge
+neighbours of the center are indexed by their quantized signature, so the
+triples matching a reference triple are found by a binary search.
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import math
+import numpy as np
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+def triple_signatures(coords):
+    """
+    Returns the signatures (N, 3) of N vertex triples given as coordinates
+    (N, 3, 3): length center-start, length center-end and angle.
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3, 3)
+    vector_a = coords[:, 0] - coords[:, 1]
+    vector_b = coords[:, 2] - coords[:, 1]
+    length_a = np.linalg.norm(vector_a, axis=1)
+    length_b = np.linalg.norm(vector_b, axis=1)
+    angle = np.arctan2(
+        np.linalg.norm(np.cross(vector_a, vector_b), axis=1),
+        np.einsum('ij,ij->i', vector_a, vector_b)
+    )
+    return np.column_stack((length_a, length_b, angle))
+
+
+def edge_triples(edges):
+    """
+    Returns all ordered triples (start, center, end) of a mesh whose start
+    and end are different edge neighbours of the center, shape (T, 3).
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    centers = np.concatenate((edges[:, 0], edges[:, 1]))
+    neighbours = np.concatenate((edges[:, 1], edges[:, 0]))
+    order = np.argsort(centers, kind='stable')
+    centers, neighbours = centers[order], neighbours[order]
+
+    # Pair every neighbour with all neighbours of the same center
+    counts = np.bincount(centers)[centers] if len(centers) else np.empty(0, dtype=np.int64)
+    starts = np.searchsorted(centers, centers)
+    first = np.repeat(np.arange(len(centers)), counts)
+    offsets = np.arange(len(first)) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = np.repeat(starts, counts) + offsets
+    keep = first != second
+    first, second = first[keep], second[keep]
+    return np.column_stack((neighbours[first], centers[first], neighbours[second]))
+
+
+def signature_keys(signatures, epsilon, angle_epsilon):
+    """
+    Quantizes signatures to integer keys (N, 3) with buckets of epsilon
+    (lengths) and angle_epsilon (angles).
+    """
+    signatures = np.asarray(signatures, dtype=np.float64).reshape(-1, 3)
+    return np.floor(signatures / [epsilon, epsilon, angle_epsilon]).astype(np.int64)
+
+
+def triple_index(coords, edges, epsilon=1e-4, angle_epsilon=math.radians(0.1)):
+    """
+    Builds the index of all edge triples of a mesh.
+
+    coords are the vertices (V, 3), edges an array of shape (E, 2). The keys
+    of the signatures are packed into one sorted int64 code each. Returns a
+    dict with the triples, their signatures and sorted codes and the
+    quantization (see find_triples).
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    triples = edge_triples(edges)
+    signatures = triple_signatures(coords[triples])
+    keys = signature_keys(signatures, epsilon, angle_epsilon)
+
+    # Pack the keys (with room for the neighbouring buckets)
+    sizes = (keys.max(axis=0) + 3) if len(keys) else np.ones(3, dtype=np.int64)
+    codes = ((keys[:, 0] + 1) * sizes[1] + keys[:, 1] + 1) * sizes[2] + keys[:, 2] + 1
+    order = np.argsort(codes, kind='stable')
+    return {
+        'triples': triples[order],
+        'signatures': signatures[order],
+        'codes': codes[order],
+        'sizes': sizes,
+        'epsilon': epsilon,
+        'angle_epsilon': angle_epsilon
+    }
+
+
+def find_triples(index, signature):
+    """
+    Returns the indexed triples (C, 3) whose signature matches signature
+    within the epsilons of the index.
+
+    Only the buckets within one epsilon of the signature are searched (at
+    most 3 per dimension), each with a binary search in the sorted codes, so
+    a lookup costs O(log T + C).
+    """
+    signature = np.asarray(signature, dtype=np.float64).reshape(3)
+    epsilon = np.array([index['epsilon'], index['epsilon'], index['angle_epsilon']])
+    sizes = index['sizes']
+    low = np.floor((signature - epsilon) / epsilon).astype(np.int64)
+    high = np.floor((signature + epsilon) / epsilon).astype(np.int64)
+
+    found = []
+    for corner in np.ndindex(*(high - low + 1)):
+        key = low + corner
+        if(np.any(key < -1) or np.any(key + 1 >= sizes)):
+            continue
+        code = ((key[0] + 1) * sizes[1] + key[1] + 1) * sizes[2] + key[2] + 1
+        start, end = np.searchsorted(index['codes'], [code, code + 1])
+        found.append(np.arange(start, end))
+    if(not found):
+        return np.empty((0, 3), dtype=np.int64)
+    found = np.unique(np.concatenate(found))
+    close = np.all(np.abs(index['signatures'][found] - signature) <= epsilon, axis=1)
+    return index['triples'][found[close]]
@@ -0,0 +1,151 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#           Core: Mitre           #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Geometry of mitred angles from profile arrays (NumPy only).
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import math
+import numpy as np
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+def mitre_geometry(coords, faces, edges, angle_ab):
+    """
+    Calculates the geometry of a mitred corner joint from a profile.
+
+    coords are the vertices of the profile (only X and Y are used, the profile
+    is flattened like before), faces a list of vertex index lists and edges
+    an array of shape (E, 2). Edges without a face (wire profiles) become
+    walls as well. angle_ab is the angle between both legs of the corner.
+
+    The first leg is extruded along its local Z-axis from the mitre plane to
+    the base, the second leg is the first one mirrored at the mitre plane.
+    Returns the vertices as an array of shape (M, 3) and the faces as a list
+    of vertex index lists in the local space of the first leg.
+    """
+    xy = np.asarray(coords, dtype=np.float64).reshape(-1, 3)[:, :2]
+    count = len(xy)
+    half = angle_ab / 2
+
+    # Mitre plane z = -x / tan(half) and base above its highest point
+    z_mitre = -xy[:, 0] * (math.cos(half) / math.sin(half))
+    z_base = max(0.0, z_mitre.max()) if count else 0.0
+
+    # Leg A (base, mitre) and leg B (base mirrored at the mitre plane)
+    base = np.column_stack((xy, np.full(count, z_base)))
+    mitre = np.column_stack((xy, z_mitre))
+    normal = np.array([math.cos(half), 0.0, math.sin(half)])
+    mirrored = base - 2 * (base @ normal)[:, None] * normal
+    vertices = np.concatenate((base, mitre, mirrored))
+
+    # Faces of the profile and walls along the legs
+    faces, start, end = profile_walls(xy, faces, edges)
+    walls_a = np.column_stack((start + count, end + count, end, start))
+    walls_b = np.column_stack((start + 2 * count, end + 2 * count, end + count, start + count))
+
+    # Weld base vertices lying on the mitre plane (former remove_doubles)
+    remap = np.arange(3 * count)
+    on_mitre = np.flatnonzero(np.isclose(z_mitre, z_base))
+    remap[on_mitre] = on_mitre + count
+    remap[on_mitre + 2 * count] = on_mitre + count
+
+    # Collect faces: caps of both legs (mirrored cap reversed) and walls
+    polygons = []
+    for face in (
+        faces +
+        [[v + 2 * count for v in reversed(f)] for f in faces] +
+        walls_a.tolist() +
+        walls_b.tolist()
+    ):
+        face = remap[face].tolist()
+        face = [v for k, v in enumerate(face) if v != face[k - 1]]
+        if(len(face) >= 3):
+            polygons.append(face)
+
+    # Remove unused vertices
+    used = np.unique(np.concatenate(polygons)) if polygons else np.empty(0, dtype=np.int64)
+    lookup = np.zeros(3 * count, dtype=np.int64)
+    lookup[used] = np.arange(len(used))
+    return vertices[used], [lookup[f].tolist() for f in polygons]
+
+
+def profile_walls(xy, faces, edges):
+    """
+    Orients the faces of a profile and finds the edges extruded to walls.
+
+    xy are the profile coordinates (V, 2), faces a list of vertex index lists
+    and edges an array of shape (E, 2). The faces are turned counter-clockwise
+    (normals along +Z). Walls are made from boundary edges (used by one face)
+    and wire edges (no face), in the direction of the oriented faces.
+    Returns the oriented faces and the start and end vertex of every wall.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    count = len(xy)
+
+    # Orient the faces counter-clockwise, so that all normals point outwards
+    sizes = np.array([len(f) for f in faces], dtype=np.int64)
+    loops = np.concatenate(faces).astype(np.int64) if len(faces) else np.empty(0, dtype=np.int64)
+    starts = np.cumsum(sizes) - sizes
+    face_of_loop = np.repeat(np.arange(len(faces)), sizes)
+    next_loop = np.arange(len(loops)) + 1
+    next_loop[starts + sizes - 1] = starts
+    v0, v1 = loops, loops[next_loop]
+    area = np.bincount(
+        face_of_loop,
+        xy[v0, 0] * xy[v1, 1] - xy[v1, 0] * xy[v0, 1],
+        len(faces)
+    )
+    flip = area < 0
+    faces = [f[::-1] if r else f for f, r in zip(map(list, faces), flip)]
+
+    # Walls from boundary edges (used by one face) and wire edges (no face)
+    flip = flip[face_of_loop]
+    start, end = np.where(flip, v1, v0), np.where(flip, v0, v1)
+    keys = np.minimum(start, end) * count + np.maximum(start, end)
+    unique, index, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    boundary = counts[index] == 1
+    wire = ~np.isin(edges.min(axis=1) * count + edges.max(axis=1), unique)
+    start = np.concatenate((start[boundary], edges[wire, 0]))
+    end = np.concatenate((end[boundary], edges[wire, 1]))
+    return faces, start, end
+
+
+def polyline_profile(polylines, fill=False):
+    """
+    Builds profile arrays (like mesh_arrays in the add-on) from polylines.
+
+    polylines is a list of (points, cyclic) tuples, points being an array of
+    shape (M, 3) without a repeated first point. Every polyline becomes a
+    chain of edges; closed polylines become a face as well if fill is True.
+    Returns the coordinates (V, 3), the faces and the edges (E, 2).
+    """
+    coords = []
+    faces = []
+    edges = []
+    offset = 0
+    for points, cyclic in polylines:
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        indices = np.arange(offset, offset + len(points))
+        coords.append(points)
+        edges.append(np.column_stack((indices[:-1], indices[1:])))
+        if(cyclic and len(points) > 2):
+            edges.append([[indices[-1], indices[0]]])
+            if(fill):
+                faces.append(indices)
+        offset += len(points)
+    return (
+        np.concatenate(coords) if coords else np.empty((0, 3)),
+        faces,
+        np.concatenate(edges).astype(np.int64) if edges else np.empty((0, 2), dtype=np.int64)
+    )
@@ -0,0 +1,207 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#           Core: Sweep           #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Sweep of a profile along a polyline with mitred corners (NumPy only).
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import numpy as np
+from .mitre import profile_walls
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+def edge_chain(edges, start=None):
+    """
+    Orders the vertices of a chain of edges (an edge path without branches).
+
+    edges is an array of shape (E, 2). The chain starts at start if it is an
+    end of the chain (or any vertex of a closed chain), otherwise at the end
+    with the lowest index. Returns the vertex indices in order and whether
+    the chain is closed, or None if the edges are not one simple chain.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if(len(edges) == 0 or np.any(edges[:, 0] == edges[:, 1])):
+        return None
+    vertices = np.unique(edges)
+    degree = np.bincount(edges.ravel(), minlength=vertices.max() + 1)[vertices]
+    if(np.any(degree > 2)):
+        return None
+    ends = vertices[degree == 1]
+    if(len(ends) not in (0, 2)):
+        return None
+    cyclic = len(ends) == 0
+
+    # Neighbours of every vertex (-1 for none)
+    neighbours = np.full((vertices.max() + 1, 2), -1, dtype=np.int64)
+    for a, b in edges.tolist():
+        neighbours[a, int(neighbours[a, 0] >= 0)] = b
+        neighbours[b, int(neighbours[b, 0] >= 0)] = a
+
+    candidates = vertices if cyclic else ends
+    if(start is None or start not in candidates):
+        start = int(candidates.min())
+    chain = [start]
+    previous = -1
+    current = start
+    for _ in range(len(vertices) - 1):
+        a, b = neighbours[current]
+        previous, current = current, int(b if a == previous else a)
+        chain.append(current)
+    if(len(set(chain)) != len(vertices)):
+        return None
+    return chain, cyclic
+
+
+def rotations(vectors_a, vectors_b):
+    """
+    Returns the matrices (N, 3, 3) of the smallest rotations turning the unit
+    vectors vectors_a into vectors_b (identity where they are parallel).
+    """
+    axes = np.cross(vectors_a, vectors_b)
+    sin = np.linalg.norm(axes, axis=1)
+    cos = np.einsum('ij,ij->i', vectors_a, vectors_b)
+    axes = axes / np.where(sin < 1e-12, 1, sin)[:, None]
+    cross = np.zeros((len(axes), 3, 3))
+    cross[:, 0, 1], cross[:, 0, 2] = -axes[:, 2], axes[:, 1]
+    cross[:, 1, 0], cross[:, 1, 2] = axes[:, 2], -axes[:, 0]
+    cross[:, 2, 0], cross[:, 2, 1] = -axes[:, 1], axes[:, 0]
+    sin = np.where(sin < 1e-12, 0, sin)[:, None, None]
+    cos = np.where(sin[:, 0, 0] == 0, 1, cos)[:, None, None]
+    return np.eye(3) + sin * cross + (1 - cos) * (cross @ cross)
+
+
+def transport_frames(points, cyclic=False):
+    """
+    Calculates the frames of the segments of a polyline by parallel transport.
+
+    The Z-axis of every frame is the direction of its segment. The Y-axis of
+    the first frame is the normal of the first corner (like the frame of a
+    vertex triple), the following frames are turned by the corner rotations
+    only, so the profile does not twist. On closed polylines the remaining
+    twist is spread over all segments. Returns an array of shape (S, 3, 3)
+    with the axes as columns.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if(cyclic):
+        points = np.concatenate((points, points[:1]))
+    directions = np.diff(points, axis=0)
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    count = len(directions)
+
+    # Rotations at the corners (corner k lies between segment k and k + 1)
+    following = np.roll(directions, -1, axis=0)
+    corners = rotations(directions, following)
+
+    # First frame from the first corner that is not straight
+    normals = np.cross(directions, following)
+    if(not cyclic):
+        normals[-1] = 0
+    bent = np.flatnonzero(np.linalg.norm(normals, axis=1) > 1e-9)
+    if(len(bent)):
+        vector_y = normals[bent[0]] / np.linalg.norm(normals[bent[0]])
+    else:
+        vector_y = np.cross(directions[0], [0.0, 0.0, 1.0])
+        if(np.linalg.norm(vector_y) < 1e-9):
+            vector_y = np.cross(directions[0], [1.0, 0.0, 0.0])
+        vector_y /= np.linalg.norm(vector_y)
+
+    # Transport the X-axis along the segments
+    vectors_x = np.empty((count, 3))
+    vectors_x[0] = np.cross(vector_y, directions[0])
+    for k in range(1, count):
+        vectors_x[k] = corners[k - 1] @ vectors_x[k - 1]
+
+    # Spread the twist of closed polylines over all segments
+    if(cyclic):
+        last = corners[-1] @ vectors_x[-1]
+        twist = np.arctan2(np.dot(np.cross(last, vectors_x[0]), directions[0]), np.dot(last, vectors_x[0]))
+        angles = twist * np.arange(count) / count
+        vectors_x = (
+            vectors_x * np.cos(angles)[:, None] +
+            np.cross(directions, vectors_x) * np.sin(angles)[:, None]
+        )
+
+    vectors_y = np.cross(directions, vectors_x)
+    return np.stack((vectors_x, vectors_y, directions), axis=2)
+
+
+def sweep_geometry(coords, faces, edges, points, cyclic=False):
+    """
+    Calculates the geometry of a profile swept along a polyline.
+
+    coords, faces and edges describe the profile like for mitre_geometry,
+    points (N, 3) is the polyline. At every inner corner the profile is
+    projected onto the mitre plane (the bisector of both segments), so the
+    whole sweep is one continuous mesh. Open polylines get caps at both ends.
+    Returns the vertices as an array of shape (N * V, 3) without unused
+    vertices and the faces as a list of vertex index lists.
+    """
+    xy = np.asarray(coords, dtype=np.float64).reshape(-1, 3)[:, :2]
+    count = len(xy)
+
+    # Remove repeated points
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.linalg.norm(np.diff(points, axis=0), axis=1) > 1e-9
+    points = points[keep]
+    if(cyclic and len(points) > 1 and np.linalg.norm(points[-1] - points[0]) <= 1e-9):
+        points = points[:-1]
+    if(len(points) < (3 if cyclic else 2) or count == 0):
+        return np.empty((0, 3)), []
+
+    frames = transport_frames(points, cyclic)
+    directions = frames[:, :, 2]
+    rings = len(points)
+    segments = len(frames)
+
+    # Planes of the rings: mitre planes at corners, square at open ends
+    if(cyclic):
+        normals = np.roll(directions, 1, axis=0) + directions
+    else:
+        normals = np.concatenate((directions[:1], directions[:-1] + directions[1:], directions[-1:]))
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.where(lengths < 1e-9, np.concatenate((directions, directions[-1:]))[:rings], normals / np.where(lengths < 1e-9, 1, lengths))
+
+    # Project the profile of the following segment onto every plane
+    segment = np.minimum(np.arange(rings), segments - 1)
+    offsets = (
+        xy[None, :, :1] * frames[segment, None, :, 0] +
+        xy[None, :, 1:] * frames[segment, None, :, 1]
+    )
+    lines = points[segment, None] + offsets
+    t = (
+        np.einsum('ijk,ik->ij', points[:, None] - lines, normals) /
+        np.einsum('ik,ik->i', directions[segment], normals)[:, None]
+    )
+    vertices = (lines + t[:, :, None] * directions[segment, None]).reshape(-1, 3)
+
+    # Walls between the rings and caps at the ends
+    faces, start, end = profile_walls(xy, faces, edges)
+    near = np.arange(segments)[:, None] * count
+    far = ((np.arange(segments) + 1) % rings)[:, None] * count
+    walls = np.stack((near + start, near + end, far + end, far + start), axis=2).reshape(-1, 4)
+    polygons = walls.tolist()
+    if(not cyclic):
+        polygons = (
+            [list(reversed(f)) for f in faces] +
+            polygons +
+            [[v + (rings - 1) * count for v in f] for f in faces]
+        )
+    if(not polygons):
+        return np.empty((0, 3)), []
+
+    # Remove unused vertices
+    used = np.unique(np.concatenate(polygons))
+    lookup = np.zeros(len(vertices), dtype=np.int64)
+    lookup[used] = np.arange(len(used))
+    return vertices[used], [lookup[f].tolist() for f in polygons]
@@ -0,0 +1,1097 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#             Geometry            #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Alignment and angle generation on Blender data.
+
+This module (and with it NumPy and the core) is imported by the operators
+on first use, so registering the add-on stays fast.
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import bpy
+import hashlib
+import math
+import numpy as np
+from collections import OrderedDict
+from mathutils import Matrix
+from mathutils.bvhtree import BVHTree
+from .core import (
+    orientation_matrices, leg_angles, mitre_geometry,
+    bezier_polyline, arc_length_table, path_frames, polyline_profile,
+    normal_frames, plane_frame, matrix_eulers, edge_chain, sweep_geometry,
+    triple_signatures, triple_index, find_triples
+)
+from .selection import select_history
+from .stats import profiled
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+def world_coordinates(obj, indices):
+    """
+    Returns the global coordinates of the vertices with the given indices.
+
+    obj is a mesh object and indices an integer array of any shape, e.g.
+    (K, 3) for a stored list of vertex triples. The result has the shape
+    indices.shape + (3,). The mesh data is read with a single foreach_get.
+    """
+    mesh = obj.data
+    coords = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', coords)
+    coords = coords.reshape(-1, 3)[np.asarray(indices, dtype=np.int64)]
+    matrix = np.array(obj.matrix_world)
+    return coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def align_objects_to_frames(objects, matrices, centers=None):
+    """
+    Aligns every object to its frame by writing matrix_world directly.
+
+    matrices is an array of shape (K, 3, 3) like returned by
+    orientation_matrices (or a single (3, 3) matrix for all objects) and
+    centers an optional array of shape (K, 3) with the new global locations.
+    The scale of the objects is kept. Since matrix_world is written instead of
+    location, child objects are aligned correctly as well.
+    """
+    count = len(objects)
+    worlds = np.array([obj.matrix_world for obj in objects]).reshape(count, 4, 4)
+    scale = np.linalg.norm(worlds[:, :3, :3], axis=1)
+    worlds[:, :3, :3] = np.broadcast_to(matrices, (count, 3, 3)) * scale[:, None, :]
+    if centers is not None:
+        worlds[:, :3, 3] = np.broadcast_to(centers, (count, 3))
+    for obj, world in zip(objects, worlds):
+        obj.matrix_world = Matrix(world.tolist())
+
+
+@profiled
+def align_to_vertices(objects, target, triples, inverse=False, move=True):
+    """
+    Aligns K objects to K vertex triples of the mesh object target.
+
+    triples is a stored list of K vertex index triples (start, center, end).
+    All frames are computed at once and written without any operator call.
+    """
+    coords = world_coordinates(target, np.asarray(triples).reshape(-1, 3))
+    matrices = orientation_matrices(coords, inverse)
+    align_objects_to_frames(objects, matrices, coords[:, 1] if move else None)
+
+
+# Custom property marking the objects and meshes written by write_instances
+CARRIER = "align_carrier"
+
+
+@profiled
+def write_instances(name, matrices, centers):
+    """
+    Writes frames into one carrier object instead of aligning objects.
+
+    The carrier is a mesh object with one vertex per frame at its center and
+    the rotation (XYZ Euler) as point attribute "rotation", ready for the
+    "Instance on Points" node of geometry nodes. Only an existing carrier
+    (marked with CARRIER) of the same name is overwritten. Returns the
+    carrier or an error message if another object has the name or the
+    attributes are not available (Blender before 2.92).
+    """
+    if('attributes' not in bpy.types.Mesh.bl_rna.properties):
+        return "Instance carriers need Blender 2.92 or newer."
+    carrier = bpy.data.objects.get(name)
+    if(carrier is not None and (carrier.type != 'MESH' or not carrier.get(CARRIER))):
+        return "'" + name + "' already exists and is no instance carrier."
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 3, 3)
+    centers = np.broadcast_to(np.asarray(centers, dtype=np.float64), (len(matrices), 3))
+    
+    # Never write into meshes of the user
+    mesh = carrier.data if carrier is not None else bpy.data.meshes.get(name)
+    if(mesh is None or not mesh.get(CARRIER)):
+        mesh = bpy.data.meshes.new(name)
+        mesh[CARRIER] = True
+    mesh.clear_geometry()
+    mesh.vertices.add(len(matrices))
+    mesh.vertices.foreach_set('co', centers.astype(np.float32).ravel())
+    rotation = mesh.attributes.get('rotation')
+    if(rotation is None):
+        rotation = mesh.attributes.new('rotation', 'FLOAT_VECTOR', 'POINT')
+    rotation.data.foreach_set('vector', matrix_eulers(matrices).astype(np.float32).ravel())
+    mesh.update()
+    
+    carrier = bpy.data.objects.get(name)
+    if(carrier is None):
+        carrier = bpy.data.objects.new(name, mesh)
+        carrier[CARRIER] = True
+        bpy.context.scene.collection.objects.link(carrier)
+    carrier.data = mesh
+    carrier.matrix_world = Matrix.Identity(4)
+    return carrier
+
+
+def selected_vertices(obj):
+    """
+    Returns the indices and global coordinates (K, 3) of the selected
+    vertices of obj in selection order, without switching modes.
+    """
+    indices, coords = select_history(obj)
+    coords = np.array(coords, dtype=np.float64).reshape(-1, 3)
+    matrix_world = np.array(obj.matrix_world)
+    return indices, coords @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+
+
+def selected_coordinates(obj):
+    """
+    Returns the global coordinates of the selected vertices of obj in
+    selection order as an array of shape (K, 3), without switching modes.
+    """
+    return selected_vertices(obj)[1]
+
+
+def vertex_frames(coords, inverse=False):
+    """
+    Calculates the frames of selected vertices taken in groups of three.
+
+    coords are the global coordinates in selection order (start, center,
+    end of every triple). Returns the orientation matrices (K, 3, 3) and the
+    centers (K, 3).
+    """
+    coords = np.asarray(coords).reshape(-1, 3, 3)
+    return orientation_matrices(coords, inverse), coords[:, 1]
+
+
+# Number of vertices per chunk of the best fit plane
+PLANE_CHUNK_SIZE = 65536
+
+
+@profiled
+def selected_plane(obj, inverse=False, chunk_size=PLANE_CHUNK_SIZE):
+    """
+    Fits a plane to all selected vertices of obj (in any number and order).
+
+    The coordinates are read once with foreach_get (as float32) and reduced
+    chunk by chunk, so no (K, 3, 3) or float64 copy of the whole selection is
+    made. In edit mode the mesh is updated from the edit mesh first, without
+    switching the mode. The normal points along the vertex normals. Returns
+    the global center and matrix like plane_frame, or None.
+    """
+    mesh = obj.data
+    if(obj.mode == 'EDIT'):
+        obj.update_from_editmode()
+    count = len(mesh.vertices)
+    select = np.empty(count, dtype=bool)
+    mesh.vertices.foreach_get('select', select)
+    coords = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    coords = coords.reshape(-1, 3)
+    normals = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('normal', normals)
+    normals = normals.reshape(-1, 3)
+    
+    # Sum of the selected normals (global)
+    matrix_world = np.array(obj.matrix_world)
+    reference = np.zeros(3)
+    for start in range(0, count, chunk_size):
+        part = select[start:start + chunk_size]
+        reference += normals[start:start + chunk_size][part].sum(axis=0, dtype=np.float64)
+    reference = reference @ np.linalg.inv(matrix_world[:3, :3])
+    
+    chunks = (
+        coords[start:start + chunk_size][select[start:start + chunk_size]] @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+        for start in range(0, count, chunk_size)
+    )
+    return plane_frame(chunks, reference, inverse)
+
+
+def save_preset(presets, name, obj, inverse=False):
+    """
+    Computes the frame of the three selected vertices of obj once and stores
+    it as a named preset in presets (an existing preset is overwritten).
+
+    Returns the preset or None if not exactly three vertices are selected.
+    """
+    indices, coords = selected_vertices(obj)
+    if(len(indices) != 3):
+        return None
+    matrices, centers = vertex_frames(coords, inverse)
+    
+    preset = presets.get(name)
+    if(preset is None):
+        preset = presets.add()
+        preset.name = name
+    preset.matrix = Matrix(matrices[0].tolist())
+    preset.origin = centers[0]
+    preset.source = obj
+    preset.indices = indices
+    preset.inverse = inverse
+    return preset
+
+
+@profiled
+def apply_preset(objects, preset, move=True):
+    """
+    Aligns all objects to a saved preset in one bulk write.
+
+    The frame is read from the preset, so applying it costs a lookup plus a
+    matrix multiply per object instead of reading the source mesh again.
+    """
+    matrix = np.array(preset.matrix, dtype=np.float64).reshape(3, 3)
+    align_objects_to_frames(objects, matrix, np.array(preset.origin) if move else None)
+
+
+@profiled
+def align_to_object(objects, active, move=True):
+    """
+    Copies the rotation (and location) of active to all objects at once.
+    """
+    matrix_world = np.array(active.matrix_world)
+    matrix = matrix_world[:3, :3]
+    norms = np.linalg.norm(matrix, axis=0)
+    matrix = matrix / np.where(norms == 0, 1, norms)
+    align_objects_to_frames(objects, matrix, matrix_world[:3, 3] if move else None)
+
+
+def pair_key(obj, prop=None):
+    """
+    Returns the key pairing obj with its counterpart: the value of the custom
+    property prop, or the name without the number Blender adds to copies
+    (e.g. "Bolt.003" -> "Bolt").
+    """
+    if(prop):
+        value = obj.get(prop)
+        return None if value is None else str(value)
+    name, dot, number = obj.name.rpartition('.')
+    return name if(dot and number.isdigit()) else obj.name
+
+
+@profiled
+def align_pairs(sources, targets, prop=None, move=True):
+    """
+    Aligns every source object to the target object with the same key.
+
+    The targets (e.g. placeholder empties) are indexed by key once, so all
+    N sources are paired in O(N) and written in one bulk write. Every target
+    takes one source, further sources with the same key are left out.
+    Returns the number of aligned objects and the names of the sources
+    without a target.
+    """
+    index = {}
+    for target in targets:
+        key = pair_key(target, prop)
+        if(key is not None):
+            index.setdefault(key, []).append(target)
+    for matches in index.values():
+        matches.reverse()
+    
+    objects = []
+    matched = []
+    missing = []
+    for source in sources:
+        matches = index.get(pair_key(source, prop))
+        if(matches):
+            objects.append(source)
+            matched.append(matches.pop())
+        else:
+            missing.append(source.name)
+    if(not objects):
+        return 0, missing
+    
+    # Rotations (without scale) and locations of all targets
+    worlds = np.array([obj.matrix_world for obj in matched]).reshape(-1, 4, 4)
+    matrices = worlds[:, :3, :3]
+    norms = np.linalg.norm(matrices, axis=1, keepdims=True)
+    matrices = matrices / np.where(norms == 0, 1, norms)
+    align_objects_to_frames(objects, matrices, worlds[:, :3, 3] if move else None)
+    return len(objects), missing
+
+
+@profiled
+def align_to_curve(objects, curve, move=0.0, spacing=0.0):
+    """
+    Places the objects along the first spline of the curve object.
+
+    The first object is placed at the distance move, the others spacing
+    apart (distances in global units, assuming a uniform scale of the curve).
+    Returns an error message if the curve can not be aligned to.
+    """
+    msg = nurbs_error(curve.data, 1)
+    if(msg):
+        return msg
+    table = curve_table(curve.data)
+    if(table is None):
+        return "The curve has no spline to align to."
+    points, lengths, cyclic = table
+    
+    # Get frames along the curve
+    matrix_world = np.array(curve.matrix_world)
+    scale = np.cbrt(abs(np.linalg.det(matrix_world[:3, :3]))) or 1
+    distances = (move + spacing * np.arange(len(objects))) / scale
+    positions, matrices = path_frames(points, lengths, distances, cyclic = cyclic)
+    
+    # Get global frames
+    positions = positions @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+    matrices = matrix_world[:3, :3] @ matrices
+    matrices /= np.linalg.norm(matrices, axis=1, keepdims=True)
+    
+    align_objects_to_frames(objects, matrices, positions)
+
+
+def mesh_arrays(mesh):
+    """
+    Reads the vertices, faces and edges of a mesh with foreach_get.
+
+    Returns the vertex coordinates as an array of shape (V, 3), the faces as
+    a list of vertex index arrays and the edges as an array of shape (E, 2).
+    """
+    coords = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', coords)
+    loops = np.empty(len(mesh.loops), dtype=np.int64)
+    mesh.loops.foreach_get('vertex_index', loops)
+    starts = np.empty(len(mesh.polygons), dtype=np.int64)
+    mesh.polygons.foreach_get('loop_start', starts)
+    totals = np.empty(len(mesh.polygons), dtype=np.int64)
+    mesh.polygons.foreach_get('loop_total', totals)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int64)
+    mesh.edges.foreach_get('vertices', edges)
+    faces = [loops[start:start + total] for start, total in zip(starts, totals)]
+    return coords.reshape(-1, 3), faces, edges.reshape(-1, 2)
+
+
+# Attribute data type -> (foreach_get key, values per element, dtype)
+ATTRIBUTE_ARRAYS = {
+    'FLOAT': ('value', 1, np.float32),
+    'INT': ('value', 1, np.int32),
+    'INT8': ('value', 1, np.int32),
+    'BOOLEAN': ('value', 1, bool),
+    'FLOAT2': ('vector', 2, np.float32),
+    'INT32_2D': ('value', 2, np.int32),
+    'FLOAT_VECTOR': ('vector', 3, np.float32),
+    'FLOAT_COLOR': ('color', 4, np.float32),
+    'BYTE_COLOR': ('color', 4, np.float32),
+    'QUATERNION': ('value', 4, np.float32)
+}
+
+
+def mesh_fingerprint(mesh, epsilon=0.0):
+    """
+    Returns a hash of the geometry, the layers and the materials of the mesh
+    or None if the mesh must not be shared (shape keys, string attributes).
+
+    The coordinates are quantized to epsilon, so meshes whose vertices differ
+    by less than epsilon get the same hash (unless a coordinate lies right at
+    the border of two steps). Edges, faces, UV maps and the attributes are
+    compared exactly. All arrays are read with foreach_get.
+    """
+    if(mesh.shape_keys is not None):
+        return None
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    if(epsilon > 0):
+        coords = np.round(coords / epsilon).astype(np.int64)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edges)
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loops)
+    totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', totals)
+    materials = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('material_index', materials)
+    smooth = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get('use_smooth', smooth)
+    sha = hashlib.sha1()
+    for array in (coords, edges, loops, totals, materials, smooth):
+        sha.update(array.tobytes())
+        sha.update(b'|')
+    # Before Blender 3.5 the UV maps are no attributes
+    for layer in mesh.uv_layers:
+        uvs = np.empty(len(layer.data) * 2, dtype=np.float32)
+        layer.data.foreach_get('uv', uvs)
+        sha.update(layer.name.encode() + b'|' + uvs.tobytes() + b'|')
+    # Attributes exist since Blender 2.91, internal ones start with a dot
+    for attribute in getattr(mesh, 'attributes', ()):
+        if(attribute.name == 'position' or attribute.name.startswith('.')):
+            continue
+        if(attribute.data_type not in ATTRIBUTE_ARRAYS):
+            return None
+        key, size, dtype = ATTRIBUTE_ARRAYS[attribute.data_type]
+        values = np.empty(len(attribute.data) * size, dtype=dtype)
+        attribute.data.foreach_get(key, values)
+        sha.update((attribute.name + attribute.domain + attribute.data_type).encode())
+        sha.update(values.tobytes())
+        sha.update(b'|')
+    sha.update('|'.join(m.name_full if m else '' for m in mesh.materials).encode())
+    return sha.hexdigest()
+
+
+@profiled
+def deduplicate_meshes(objects, epsilon=0.0, purge=True):
+    """
+    Links all mesh objects with identical geometry to one shared mesh.
+
+    Every mesh is fingerprinted only once, even if it is used by several
+    objects. Objects with vertex groups and meshes with shape keys keep their
+    mesh. If purge is True, meshes without users afterwards are removed.
+    Returns the number of objects that got another mesh.
+    """
+    shared = {}
+    fingerprints = {}
+    replaced = set()
+    count = 0
+    for obj in objects:
+        if(obj.type != 'MESH' or obj.vertex_groups):
+            continue
+        mesh = obj.data
+        if(mesh not in fingerprints):
+            fingerprints[mesh] = mesh_fingerprint(mesh, epsilon)
+        if(fingerprints[mesh] is None):
+            continue
+        mesh_shared = shared.setdefault(fingerprints[mesh], mesh)
+        if(mesh_shared != mesh):
+            obj.data = mesh_shared
+            replaced.add(mesh)
+            count += 1
+    if(purge):
+        for mesh in replaced:
+            if(mesh.users == 0):
+                bpy.data.meshes.remove(mesh)
+    return count
+
+
+# Maximum number of angle meshes kept in the cache
+ANGLE_CACHE_SIZE = 256
+
+# Angles are quantized to this step (in radians) to build the cache key
+ANGLE_CACHE_STEP = math.radians(0.01)
+
+# (profile hash, quantized angle) -> mesh name, least recently used first.
+# Names instead of meshes, since undo and redo invalidate all references.
+angle_cache = OrderedDict()
+
+# profile name -> (profile hash, profile arrays)
+profile_cache = {}
+
+# Names of cached angle meshes whose creation was not seen by cache_update yet
+angle_fresh = set()
+
+
+def profile_hash(coords, faces, edges):
+    """
+    Returns a hash of the profile arrays.
+    """
+    sha = hashlib.sha1(np.asarray(coords, dtype=np.float32).tobytes())
+    for face in faces:
+        sha.update(np.asarray(face, dtype=np.int64).tobytes())
+        sha.update(b'|')
+    sha.update(np.asarray(edges, dtype=np.int64).tobytes())
+    return sha.hexdigest()
+
+
+def profile_data(profile):
+    """
+    Returns the hash and the arrays (see mesh_arrays) of the profile.
+
+    Both are cached per profile until its geometry is edited, so a batch of
+    angles reads and hashes the profile only once.
+    """
+    if(profile.name_full not in profile_cache):
+        arrays = mesh_arrays(profile)
+        profile_cache[profile.name_full] = (profile_hash(*arrays), arrays)
+    return profile_cache[profile.name_full]
+
+
+def curve_profile_data(profile):
+    """
+    Returns the hash and the arrays (see mesh_arrays) of a curve profile.
+
+    All splines are tessellated into polylines only once per curve and
+    resolution. Closed splines of filled 2D curves become faces.
+    """
+    key = (profile.name_full, profile.resolution_u)
+    if(key not in profile_cache):
+        arrays = polyline_profile(
+            curve_polylines(profile),
+            profile.dimensions == '2D' and profile.fill_mode != 'NONE'
+        )
+        profile_cache[key] = (profile_hash(*arrays), arrays)
+    return profile_cache[key]
+
+
+def cached_angle_mesh(key):
+    """
+    Returns the cached mesh for the key or None and marks it as recently used.
+    """
+    name = angle_cache.get(key)
+    if(name is None):
+        return None
+    mesh = bpy.data.meshes.get(name)
+    if(mesh is None or not mesh.get(GENERATED)):
+        # The mesh was removed or renamed in the meantime
+        del angle_cache[key]
+        return None
+    angle_cache.move_to_end(key)
+    return mesh
+
+
+def cache_angle_mesh(key, mesh):
+    """
+    Adds the mesh to the cache and evicts the least recently used meshes.
+    """
+    angle_cache[key] = mesh.name_full
+    angle_cache.move_to_end(key)
+    angle_fresh.add(mesh.name_full)
+    while(len(angle_cache) > ANGLE_CACHE_SIZE):
+        name = angle_cache.popitem(last=False)[1]
+        angle_fresh.discard(name)
+        mesh = bpy.data.meshes.get(name)
+        if(mesh is not None):
+            release_mesh(mesh)
+
+
+def clear_angle_cache(profile_hash=None):
+    """
+    Removes all cached angles or only the angles of the given profile hash.
+
+    Clearing all angles only forgets the names (the file may have changed),
+    the meshes of a single profile are released.
+    """
+    if(profile_hash is None):
+        angle_cache.clear()
+        angle_fresh.clear()
+        profile_cache.clear()
+        return
+    names = [angle_cache.pop(k) for k in [k for k in angle_cache if k[0] == profile_hash]]
+    angle_fresh.difference_update(names)
+    # Called by the handlers as well, so nothing is removed here
+    for name in names:
+        mesh = bpy.data.meshes.get(name)
+        if(mesh is not None):
+            release_mesh(mesh, False)
+
+
+# Maximum number of unused generated meshes kept for reuse
+MESH_POOL_SIZE = 64
+
+# Custom property marking the meshes generated by the tool
+GENERATED = "align_generated"
+
+# Names of unused generated meshes, filled again instead of creating new
+# datablocks (names, since undo and redo invalidate all references)
+mesh_pool = []
+
+
+def new_mesh(name):
+    """
+    Returns an empty mesh for generated geometry, taken from the pool if
+    possible. Every mesh is marked as generated, so it can be released
+    again when it is not used anymore.
+    """
+    while(mesh_pool):
+        mesh = bpy.data.meshes.get(mesh_pool.pop())
+        if(mesh is None or mesh.users != 0 or not mesh.get(GENERATED)):
+            # The mesh was removed or used in the meantime
+            continue
+        mesh.clear_geometry()
+        mesh.materials.clear()
+        mesh.name = name
+        return mesh
+    mesh = bpy.data.meshes.new(name)
+    mesh[GENERATED] = True
+    return mesh
+
+
+def release_mesh(mesh, remove=True):
+    """
+    Puts a generated mesh without users into the pool (or removes it if the
+    pool is full and remove is True). Meshes that are used, cached or not
+    generated are kept.
+    """
+    name = mesh.name_full
+    if(mesh.users != 0 or not mesh.get(GENERATED) or name in angle_cache.values()):
+        return
+    if(len(mesh_pool) < MESH_POOL_SIZE and name not in mesh_pool):
+        mesh_pool.append(name)
+    elif(remove):
+        if(name in mesh_pool):
+            mesh_pool.remove(name)
+        bpy.data.meshes.remove(mesh)
+
+
+def release_orphans():
+    """
+    Releases all generated meshes without users that are not cached, e.g.
+    the meshes of deleted angles. Called before generating a batch.
+    """
+    for mesh in [m for m in bpy.data.meshes if(m.users == 0 and m.get(GENERATED))]:
+        release_mesh(mesh)
+
+
+def clear_mesh_pool():
+    """
+    Removes the meshes left in the pool. Called after generating a batch, so
+    no orphan meshes stay in the file.
+    """
+    while(mesh_pool):
+        mesh = bpy.data.meshes.get(mesh_pool.pop())
+        if(mesh is not None and mesh.users == 0 and mesh.get(GENERATED)):
+            bpy.data.meshes.remove(mesh)
+
+
+# curve name -> (points, lengths, cyclic) of its first spline
+curve_cache = {}
+
+
+def nurbs_error(curve, count=None):
+    """
+    Returns an error message if one of the first count (or all) splines of
+    the curve is a NURBS spline, else None.
+    """
+    if(any(spline.type == 'NURBS' for spline in list(curve.splines)[:count])):
+        return "NURBS splines of '" + curve.name + "' are not supported, set them to Bezier or Poly."
+    return None
+
+
+def curve_polylines(curve):
+    """
+    Tessellates the splines of the curve into polylines.
+
+    Bezier splines are evaluated with their resolution, poly splines are
+    taken by their points. NURBS splines are not supported (see nurbs_error),
+    their control points would only approximate them. Returns a list of
+    (points, cyclic) tuples, closed polylines do not repeat their first point.
+    """
+    polylines = []
+    for spline in curve.splines:
+        if(spline.type == 'BEZIER'):
+            count = len(spline.bezier_points)
+            arrays = []
+            for attr in ('co', 'handle_left', 'handle_right'):
+                array = np.empty(count * 3)
+                spline.bezier_points.foreach_get(attr, array)
+                arrays.append(array)
+            points = bezier_polyline(*arrays, spline.resolution_u, spline.use_cyclic_u)
+            if(spline.use_cyclic_u):
+                points = points[:-1]
+        else:
+            points = np.empty(len(spline.points) * 4)
+            spline.points.foreach_get('co', points)
+            points = points.reshape(-1, 4)[:, :3]
+        polylines.append((points, spline.use_cyclic_u))
+    return polylines
+
+
+def curve_table(curve):
+    """
+    Returns the cached arc-length table of the first spline of the curve.
+
+    Returns None if the curve has no spline with a length.
+    """
+    if(curve.name_full not in curve_cache):
+        table = None
+        if(len(curve.splines) > 0):
+            points, cyclic = curve_polylines(curve)[0]
+            if(cyclic):
+                points = np.concatenate((points, points[:1]))
+            points, lengths = arc_length_table(points)
+            if(len(points) > 1):
+                table = (points, lengths, cyclic)
+        curve_cache[curve.name_full] = table
+    return curve_cache[curve.name_full]
+
+
+# mesh name -> BVH tree of the mesh (in local space)
+bvh_cache = {}
+
+
+def mesh_bvh(mesh):
+    """
+    Returns the cached BVH tree of the mesh, built once until it is edited.
+    """
+    if(mesh.name_full not in bvh_cache):
+        coords, faces, edges = mesh_arrays(mesh)
+        bvh_cache[mesh.name_full] = BVHTree.FromPolygons(
+            coords.tolist(),
+            [f.tolist() for f in faces]
+        )
+    return bvh_cache[mesh.name_full]
+
+
+@profiled
+def align_to_surface(objects, target, move=True):
+    """
+    Aligns the objects to the nearest point and normal on the mesh target.
+
+    The Z-axis of each object is aligned to the normal, the X-axis keeps its
+    direction as far as possible. The BVH tree of the target is built once
+    and all objects are transformed in one batch.
+    """
+    if(not objects):
+        return
+    bvh = mesh_bvh(target.data)
+    
+    # Get the locations of the objects in the local space of the target
+    matrix_world = np.array(target.matrix_world)
+    matrix_inverse = np.linalg.inv(matrix_world)
+    worlds = np.array([obj.matrix_world for obj in objects]).reshape(-1, 4, 4)
+    locations = worlds[:, :3, 3] @ matrix_inverse[:3, :3].T + matrix_inverse[:3, 3]
+    
+    # Find the nearest points and normals
+    points = np.empty((len(objects), 3))
+    normals = np.empty((len(objects), 3))
+    found = np.zeros(len(objects), dtype=bool)
+    for i, location in enumerate(locations.tolist()):
+        point, normal, index, distance = bvh.find_nearest(location)
+        if(point is not None):
+            points[i] = point
+            normals[i] = normal
+            found[i] = True
+    
+    # Get global points and normals
+    points = points @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+    normals = normals @ matrix_inverse[:3, :3]
+    
+    # Align objects
+    objects = [obj for obj, f in zip(objects, found) if f]
+    matrices = normal_frames(normals[found], worlds[found, :3, 0])
+    align_objects_to_frames(objects, matrices, points[found] if move else None)
+
+
+# (mesh name, tolerance) -> (triple index, coordinates) of the mesh (in local space)
+triple_cache = {}
+
+# Custom property holding the reference triple of a part
+REFERENCE = "align_reference"
+
+
+def mesh_triple_index(mesh, tolerance=1e-3):
+    """
+    Returns the cached triple index (see core.hashing) and the vertex
+    coordinates of the mesh, built once per tolerance until it is edited.
+
+    Lengths match within tolerance times the mean edge length of the mesh,
+    angles within tolerance (in radians).
+    """
+    key = (mesh.name_full, tolerance)
+    if(key not in triple_cache):
+        coords = np.empty(len(mesh.vertices) * 3)
+        mesh.vertices.foreach_get('co', coords)
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int64)
+        mesh.edges.foreach_get('vertices', edges)
+        coords = coords.reshape(-1, 3)
+        edges = edges.reshape(-1, 2)
+        length = np.linalg.norm(coords[edges[:, 0]] - coords[edges[:, 1]], axis=1).mean() if len(edges) else 0.0
+        triple_cache[key] = (triple_index(coords, edges, tolerance * (length or 1.0), tolerance), coords)
+    return triple_cache[key]
+
+
+def set_reference(obj):
+    """
+    Stores the three selected vertices of obj as its reference triple.
+
+    Returns False if not exactly three vertices are selected.
+    """
+    indices = select_history(obj)[0]
+    if(len(indices) != 3):
+        return False
+    obj[REFERENCE] = indices
+    return True
+
+
+def reference_triple(obj):
+    """
+    Returns the reference triple of obj (or its three selected vertices if
+    it has none) or None.
+    """
+    indices = list(obj.get(REFERENCE, []))
+    if(len(indices) != 3):
+        indices = select_history(obj)[0]
+    if(len(indices) == 3 and all(0 <= i < len(obj.data.vertices) for i in indices)):
+        return indices
+    return None
+
+
+@profiled
+def auto_align(objects, target, move=True, tolerance=1e-3):
+    """
+    Finds the triple of target matching the reference triple of every object
+    and aligns the objects so that both triples coincide.
+
+    The triples are looked up in the cached index of the target by their
+    lengths and angle, so no vertices have to be picked on the target. Of
+    several matches the object takes the one nearest to its location that no
+    other object took. Only triples along edges of the target are found and
+    the target has to be scaled uniformly. The tolerance is relative to the
+    mean edge length of the target (see mesh_triple_index). Returns the
+    names of the objects without a match.
+    """
+    index, target_coords = mesh_triple_index(target.data, tolerance)
+    target_world = np.array(target.matrix_world)
+    target_scale = np.linalg.norm(target_world[:3, :3], axis=0).mean()
+    
+    used = set()
+    aligned = []
+    matrices = []
+    centers = []
+    missing = []
+    for obj in objects:
+        triple = reference_triple(obj) if obj.type == 'MESH' else None
+        if(triple is None):
+            missing.append(obj.name)
+            continue
+        
+        # Reference triple in the (scaled) local space of the object
+        world = np.array(obj.matrix_world)
+        scale = np.linalg.norm(world[:3, :3], axis=0)
+        reference = np.array([obj.data.vertices[i].co for i in triple]) * scale
+        signature = triple_signatures(reference)[0] / [target_scale, target_scale, 1]
+        
+        # Unused candidates (a triple and its reverse count as one)
+        candidates = [
+            c for c in find_triples(index, signature).tolist()
+            if((c[1], frozenset((c[0], c[2]))) not in used)
+        ]
+        if(not candidates):
+            missing.append(obj.name)
+            continue
+        coords = target_coords[candidates] @ target_world[:3, :3].T + target_world[:3, 3]
+        best = int(np.argmin(np.linalg.norm(coords[:, 1] - world[:3, 3], axis=1)))
+        c = candidates[best]
+        used.add((c[1], frozenset((c[0], c[2]))))
+        
+        # Rotation turning the reference frame into the frame on the target
+        frames = orientation_matrices(np.stack((coords[best], reference)))
+        matrix = frames[0] @ frames[1].T
+        aligned.append(obj)
+        matrices.append(matrix)
+        centers.append(coords[best][1] - matrix @ reference[1])
+    
+    if(aligned):
+        align_objects_to_frames(aligned, np.array(matrices), np.array(centers) if move else None)
+    return missing
+
+
+def cache_update(scene, depsgraph):
+    """
+    Invalidates the cached data of every mesh or curve that was edited.
+    """
+    for update in depsgraph.updates:
+        if(not update.is_updated_geometry):
+            continue
+        data = update.id.original
+        if(isinstance(data, bpy.types.Mesh)):
+            # An edited angle mesh must not be reused, its creation is no edit
+            name = data.name_full
+            if(name in angle_fresh):
+                angle_fresh.discard(name)
+            else:
+                for key in [k for k, v in angle_cache.items() if v == name]:
+                    del angle_cache[key]
+        if(isinstance(data, bpy.types.Object)):
+            data = data.data
+        if(isinstance(data, bpy.types.Mesh)):
+            bvh_cache.pop(data.name_full, None)
+            for key in [k for k in triple_cache if k[0] == data.name_full]:
+                del triple_cache[key]
+            cached = profile_cache.pop(data.name_full, None)
+            if(cached is not None):
+                clear_angle_cache(cached[0])
+        elif(isinstance(data, bpy.types.Curve)):
+            name = data.name_full
+            curve_cache.pop(name, None)
+            for key in [k for k in profile_cache if type(k) is tuple and k[0] == name]:
+                clear_angle_cache(profile_cache.pop(key)[0])
+
+
+def cache_load(*args):
+    """
+    Clears all caches when another file is loaded.
+    """
+    clear_angle_cache()
+    curve_cache.clear()
+    bvh_cache.clear()
+    triple_cache.clear()
+    mesh_pool.clear()
+
+
+def cache_undo(*args):
+    """
+    Clears the caches after undo or redo, which may have restored other
+    versions of the meshes and curves.
+    """
+    cache_load()
+
+
+@profiled
+def add_angle_from_mesh(target, profile, linked=True, triple=None):
+    """
+    Creates an angle from the mesh profile at the selected vertices of target
+    (or at the vertex indices triple).
+    """
+    if(target is None):
+        return 'Target can not be None!'
+    if(type(target) is not bpy.types.Object or target.type != 'MESH'):
+        return 'Target must be an object of type Mesh'
+    if(profile is None):
+        return 'Profile can not be None!'
+    if type(profile) is not bpy.types.Mesh:
+        return 'Profile must be a mesh!'
+    
+    return add_angle(target, profile, profile_data(profile), linked, triple)
+
+
+@profiled
+def add_angle_from_curve(target, profile, linked=True, triple=None):
+    """
+    Creates an angle from the curve profile at the selected vertices of target
+    (or at the vertex indices triple).
+    """
+    if(target is None):
+        return 'Target can not be None!'
+    if(type(target) is not bpy.types.Object or target.type != 'MESH'):
+        return 'Target must be an object of type Mesh'
+    if(profile is None):
+        return 'Profile can not be None!'
+    if type(profile) is not bpy.types.Curve:
+        return 'Profile must be a curve!'
+    if(nurbs_error(profile)):
+        return nurbs_error(profile)
+    
+    return add_angle(target, profile, curve_profile_data(profile), linked, triple)
+
+
+def add_angle(target, profile, data, linked=True, triple=None):
+    """
+    Creates an angle at the selected vertices of target, or at the vertices
+    with the indices triple (start, center, end) if given.
+
+    data is the hash and the arrays of the profile (see profile_data). The
+    mitred geometry is calculated directly from the arrays and written with
+    a single from_pydata, so neither an operator context nor a mode switch
+    is needed. If linked is True, the mesh of an already generated angle with
+    the same profile and angle is reused (linked data) instead of generating
+    the geometry again.
+    """
+    # Get the selected vertices of the target (in selection order)
+    if(triple is None):
+        coords = selected_coordinates(target)
+    elif(len(triple) == 3 and all(0 <= i < len(target.data.vertices) for i in triple)):
+        coords = world_coordinates(target, triple)
+    else:
+        return 'The vertices ' + str(list(triple)) + ' do not exist in ' + target.name + '.'
+    if(len(coords) != 3):
+        return 'Please make sure that you have selected exactly three vertices from ' + target.name + ' (manually vertex by vertex).'
+    
+    # Berechne Winkel zwischen Objekten. #
+    with np.errstate(divide='ignore', invalid='ignore'):
+        angleAB = float(leg_angles(coords)[0])
+    if(
+        not math.isfinite(angleAB) or
+        angleAB < ANGLE_CACHE_STEP or
+        angleAB > math.pi - ANGLE_CACHE_STEP
+    ):
+        return 'The selected vertices of ' + target.name + ' do not form a corner (they coincide or lie on a line).'
+    
+    # Get the frames of both parts
+    coords = np.stack((coords, coords))
+    matrices = orientation_matrices(coords, [False, True])
+    
+    # Build the angle (or reuse it) and align it to the first part
+    key = (data[0], round(angleAB / ANGLE_CACHE_STEP))
+    mesh = cached_angle_mesh(key) if linked else None
+    if(mesh is None):
+        vertices, faces = mitre_geometry(*data[1], angleAB)
+        mesh = new_mesh(profile.name)
+        mesh.from_pydata(vertices.tolist(), [], faces)
+        mesh.update()
+        for material in profile.materials:
+            mesh.materials.append(material)
+        if(linked):
+            cache_angle_mesh(key, mesh)
+    part = bpy.data.objects.new(profile.name, mesh)
+    bpy.context.scene.collection.objects.link(part)
+    align_objects_to_frames([part], matrices[0], coords[0][1])
+    
+    return part
+
+
+def selected_chain(obj):
+    """
+    Returns the global coordinates (N, 3) of the selected edge path of obj in
+    order and whether it is closed, or None if the selected edges are not one
+    path without branches. The path starts at the first selected vertex if
+    that is one of its ends.
+    """
+    mesh = obj.data
+    if(obj.mode == 'EDIT'):
+        obj.update_from_editmode()
+    count = len(mesh.edges)
+    select = np.empty(count, dtype=bool)
+    mesh.edges.foreach_get('select', select)
+    edges = np.empty(count * 2, dtype=np.int64)
+    mesh.edges.foreach_get('vertices', edges)
+    history = select_history(obj)[0]
+    chain = edge_chain(edges.reshape(-1, 2)[select], history[0] if history else None)
+    if(chain is None):
+        return None
+    indices, cyclic = chain
+    return world_coordinates(obj, indices), cyclic
+
+
+@profiled
+def add_sweep_from_mesh(target, profile):
+    """
+    Sweeps the mesh profile along the selected edge path of target.
+    """
+    if(target is None or type(target) is not bpy.types.Object or target.type != 'MESH'):
+        return 'Target must be an object of type Mesh'
+    if(profile is None or type(profile) is not bpy.types.Mesh):
+        return 'Profile must be a mesh!'
+    
+    return add_sweep(target, profile, profile_data(profile))
+
+
+@profiled
+def add_sweep_from_curve(target, profile):
+    """
+    Sweeps the curve profile along the selected edge path of target.
+    """
+    if(target is None or type(target) is not bpy.types.Object or target.type != 'MESH'):
+        return 'Target must be an object of type Mesh'
+    if(profile is None or type(profile) is not bpy.types.Curve):
+        return 'Profile must be a curve!'
+    if(nurbs_error(profile)):
+        return nurbs_error(profile)
+    
+    return add_sweep(target, profile, curve_profile_data(profile))
+
+
+def add_sweep(target, profile, data):
+    """
+    Sweeps a profile along the selected edge path of target.
+
+    All corner frames and mitre planes are calculated at once (see
+    sweep_geometry) and the whole sweep is written as one mesh with a single
+    from_pydata, instead of one angle per corner joined by operators.
+    """
+    chain = selected_chain(target)
+    if(chain is None):
+        return 'Please make sure that you have selected one edge path without branches from ' + target.name + '.'
+    points, cyclic = chain
+    vertices, faces = sweep_geometry(*data[1], points, cyclic)
+    if(not faces):
+        return 'The edge path of ' + target.name + ' is too short to sweep.'
+    
+    # The origin of the sweep is the start of the path
+    mesh = new_mesh(profile.name)
+    mesh.from_pydata((vertices - points[0]).tolist(), [], faces)
+    mesh.update()
+    for material in profile.materials:
+        mesh.materials.append(material)
+    part = bpy.data.objects.new(profile.name, mesh)
+    part.location = points[0].tolist()
+    bpy.context.scene.collection.objects.link(part)
+    
+    return part
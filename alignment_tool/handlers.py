@@ -0,0 +1,81 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#            Handlers             #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Application handlers, registered at startup without loading the geometry.
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import bpy
+import importlib
+import sys
+
+# # # # # # # # # # # # # # # # # #
+#            Handlers             #
+# # # # # # # # # # # # # # # # # #
+
+def loaded_geometry():
+    """
+    Returns the geometry module if it was loaded already, otherwise None.
+
+    As long as the geometry was not used, there are no caches to update.
+    """
+    return sys.modules.get(__package__ + '.geometry')
+
+
+def loaded_live():
+    """
+    Returns the live module if it was loaded already, otherwise None.
+    """
+    return sys.modules.get(__package__ + '.live')
+
+
+@bpy.app.handlers.persistent
+def cache_update(scene, depsgraph):
+    """
+    Invalidates the caches of the geometry for every edited mesh or curve
+    and aligns the live objects.
+    """
+    geometry = loaded_geometry()
+    if(geometry is not None):
+        geometry.cache_update(scene, depsgraph)
+    live = loaded_live()
+    if(live is not None):
+        live.live_update(scene, depsgraph)
+
+
+@bpy.app.handlers.persistent
+def cache_load(*args):
+    """
+    Clears the caches of the geometry when another file is loaded and loads
+    the live alignment if the file contains live objects.
+    """
+    geometry = loaded_geometry()
+    if(geometry is not None):
+        geometry.cache_load()
+    live = loaded_live()
+    if(live is not None):
+        live.clear_index()
+    elif(any(obj.align_live.source is not None for obj in bpy.data.objects)):
+        importlib.import_module(__package__ + '.live')
+
+
+@bpy.app.handlers.persistent
+def cache_undo(*args):
+    """
+    Clears the caches of the geometry after undo or redo, since Blender
+    invalidates all references to data blocks then.
+    """
+    geometry = loaded_geometry()
+    if(geometry is not None):
+        geometry.cache_undo()
+    live = loaded_live()
+    if(live is not None):
+        live.clear_index()
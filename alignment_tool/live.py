@@ -0,0 +1,208 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#              Live               #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Live alignment: objects aligned to vertices follow their source triple.
+
+Every linked object stores its source object and vertex triple (see
+AlignLink). A reverse index maps every source vertex to the objects
+depending on it, so after an edit only the frames of the moved vertices are
+computed again (see live_update).
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import bpy
+import bmesh
+import numpy as np
+from .core import orientation_matrices
+from .geometry import align_objects_to_frames
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+# Reverse index: source object name -> {vertex index -> set of object names}
+live_index = {}
+
+# Last known local coordinates of the indexed vertices per source object
+live_coords = {}
+
+# The index has to be built again (links changed or another file loaded)
+live_dirty = True
+
+# Set while the objects are aligned, so the own updates are ignored
+live_running = False
+
+
+def link(objects, target, triples, inverse=False, move=True):
+    """
+    Links every object to its vertex triple (start, center, end) of target.
+    """
+    global live_dirty
+    for obj, triple in zip(objects, triples):
+        obj.align_live.source = target
+        obj.align_live.indices = [int(i) for i in triple]
+        obj.align_live.inverse = inverse
+        obj.align_live.move = move
+    live_dirty = True
+
+
+def unlink(objects):
+    """
+    Removes the live links of the objects.
+    """
+    global live_dirty
+    for obj in objects:
+        if(obj.align_live.source is not None):
+            obj.align_live.source = None
+            live_dirty = True
+
+
+def clear_index(*args):
+    """
+    Marks the index to be built again, e.g. when another file is loaded.
+    """
+    global live_dirty
+    live_index.clear()
+    live_coords.clear()
+    live_dirty = True
+
+
+def build_index():
+    """
+    Builds the reverse index over all linked objects of the file.
+    """
+    global live_dirty
+    live_index.clear()
+    live_coords.clear()
+    for obj in bpy.data.objects:
+        source = obj.align_live.source
+        if(source is None or source.type != 'MESH'):
+            continue
+        vertices = live_index.setdefault(source.name_full, {})
+        for i in obj.align_live.indices:
+            vertices.setdefault(i, set()).add(obj.name_full)
+    for name, vertices in live_index.items():
+        live_coords[name] = source_coordinates(bpy.data.objects[name], list(vertices))
+    live_dirty = False
+
+
+def index_renamed():
+    """
+    Returns True if a source object of the index was renamed or removed.
+    """
+    objects = bpy.data.objects
+    return any(name not in objects for name in live_index)
+
+
+def source_coordinates(source, indices):
+    """
+    Returns the local coordinates of the vertices of source as a dict, also
+    while the mesh is in edit mode. Missing vertices are left out.
+
+    The indices refer to the mesh outside of edit mode. While vertices are
+    added or removed in edit mode they are ambiguous, so no vertex is
+    returned until edit mode is left.
+    """
+    if(source.mode == 'EDIT'):
+        bm = bmesh.from_edit_mesh(source.data)
+        if(len(bm.verts) != len(source.data.vertices)):
+            return {}
+        bm.verts.ensure_lookup_table()
+        verts = bm.verts
+    else:
+        verts = source.data.vertices
+    count = len(verts)
+    return {i: tuple(verts[i].co) for i in indices if 0 <= i < count}
+
+
+def realign(names, source):
+    """
+    Aligns the objects with the given names to their triples of source.
+
+    Returns False if an object was not found (renamed or removed), so the
+    index has to be built again.
+    """
+    global live_dirty
+    coords = live_coords[source.name_full]
+    objects = []
+    found = True
+    for name in sorted(names):
+        obj = bpy.data.objects.get(name)
+        if(obj is None):
+            live_dirty = True
+            found = False
+            continue
+        if(obj.align_live.source != source):
+            continue
+        if(all(i in coords for i in obj.align_live.indices)):
+            objects.append(obj)
+    if(not objects):
+        return found
+    
+    # Compute all frames of this source at once
+    matrix_world = np.array(source.matrix_world)
+    triples = np.array([[coords[i] for i in obj.align_live.indices] for obj in objects])
+    triples = triples @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+    matrices = orientation_matrices(triples, [obj.align_live.inverse for obj in objects])
+    
+    # Objects without 'Move' keep their location
+    centers = np.array([
+        triples[k, 1] if obj.align_live.move else obj.matrix_world.translation
+        for k, obj in enumerate(objects)
+    ])
+    align_objects_to_frames(objects, matrices, centers)
+    return found
+
+
+def live_update(scene, depsgraph):
+    """
+    Aligns the objects whose source vertices moved or whose source object
+    was transformed.
+    """
+    global live_running
+    if(live_running):
+        return
+    if(live_dirty or index_renamed()):
+        build_index()
+    if(not live_index):
+        return
+    
+    live_running = True
+    try:
+        for update in depsgraph.updates:
+            source = update.id.original
+            if(not isinstance(source, bpy.types.Object) or source.name_full not in live_index):
+                continue
+            vertices = live_index[source.name_full]
+            
+            if(update.is_updated_transform):
+                # Every frame of the source changes
+                live_coords[source.name_full] = source_coordinates(source, list(vertices))
+                names = set().union(*vertices.values())
+            elif(update.is_updated_geometry):
+                # Only the frames of moved vertices change
+                old = live_coords[source.name_full]
+                new = source_coordinates(source, list(vertices))
+                live_coords[source.name_full] = new
+                names = set()
+                for i, co in new.items():
+                    if(old.get(i) != co):
+                        names |= vertices[i]
+            else:
+                continue
+            
+            if(names and not realign(names, source)):
+                # A linked object was renamed, so align all of them by the new index
+                build_index()
+                if(source.name_full in live_index):
+                    realign(set().union(*live_index[source.name_full].values()), source)
+    finally:
+        live_running = False
@@ -0,0 +1,1060 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#            Operators            #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import bpy
+import time
+from mathutils import Matrix
+from .stats import profiled, begin_record, end_record, stats, export_stats
+
+# # # # # # # # # # # # # # # # # #
+#            Operators            #
+# # # # # # # # # # # # # # # # # #
+
+class SetOrientationToObjectOperator(bpy.types.Operator):
+    """Align the transformation axes to the active object"""
+    bl_idname = "align.set_orientation_to_object"
+    bl_label = "to active object"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+    
+    @profiled
+    def execute(self, context):
+        
+        obj_src = context.active_object
+        
+        bpy.ops.transform.create_orientation(name = "Align", use = True, overwrite = True)
+        return {'FINISHED'}
+
+class SetOrientationToVerticesOperator(bpy.types.Operator):
+    """Align the transformation axes to the selected vertices"""
+    bl_idname = "align.set_orientation_to_vertices"
+    bl_label = "to vertices"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    source: bpy.props.EnumProperty(
+        name = "Source",
+        items = [
+            ('TRIPLE', "Triple", "Three vertices selected vertex by vertex (start, center, end)"),
+            ('PLANE', "Best Fit Plane", "Plane fitted to any number of selected vertices")
+        ],
+        default = 'TRIPLE',
+        description = "How the orientation is computed from the selected vertices"
+    )
+    
+    inverse: bpy.props.BoolProperty(
+        name = "Inverse",
+        default = False,
+        description = "Inverse the alignment of the Z-axis"
+    )
+    
+    # Properties
+    select: bpy.props.BoolProperty(
+        name = "Select Orientation",
+        default = True,
+        description = "Set transformation orientation to 'Align'"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.active_object is not None and
+            context.active_object.type == 'MESH'
+        )
+    
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        error_msg = ""
+        
+        obj = context.active_object
+        bpy.ops.transform.create_orientation(name = "Align", use = True, overwrite = True)
+        orientation = context.scene.transform_orientation_slots[0].type
+        
+        # Get orientation matrix (without switching the mode)
+        if(self.source == 'PLANE'):
+            plane = geometry.selected_plane(obj, self.inverse)
+            matrices = None if plane is None else plane[1][None]
+        else:
+            coords = geometry.selected_coordinates(obj)
+            matrices = None if len(coords) != 3 else geometry.vertex_frames(coords, self.inverse)[0]
+        
+        if(matrices is None):
+            if(self.source == 'PLANE'):
+                error_msg = "Please make sure that you have selected at least three vertices from the active object."
+            else:
+                error_msg = "Please make sure that you have selected exactly three vertices from the active object (manually vertex by vertex)."
+        else:
+            # Build matrix
+            matrix = Matrix(matrices[0].tolist())
+            
+            # Set Orientation
+            bpy.ops.transform.select_orientation(orientation="Align")
+            context.scene.transform_orientation_slots[0].custom_orientation.matrix = matrix
+        
+        # Reset orientation
+        if(not self.select):
+            bpy.ops.transform.select_orientation(orientation=orientation)
+        
+        if(error_msg == ""):
+            return {'FINISHED'}
+        
+        self.report({'ERROR'}, error_msg)
+        return {'CANCELLED'}
+
+class AlignToOrientationOperator(bpy.types.Operator):
+    """Align selected objects"""
+    bl_idname = "align.align_to_orientation"
+    bl_label = "to orientation"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    
+    # Methods
+    @profiled
+    def execute(self, context):
+        
+        bpy.ops.transform.transform(mode='ALIGN')
+        
+        return {'FINISHED'}
+
+class AlignToObjectOperator(bpy.types.Operator):
+    """Align selected objects to active object"""
+    bl_idname = "align.align_to_object"
+    bl_label = "to active object"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    
+    move: bpy.props.BoolProperty(
+        name = "Move",
+        default = True,
+        description = "Move the object to active object"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and (
+            len(context.selected_objects) > 1 or (
+                len(context.selected_objects) == 1 and
+                not context.active_object.select_get()
+            )
+        )
+    
+    @profiled
+    def execute(self, context):
+        
+        from . import geometry
+        
+        obj = context.active_object
+        geometry.align_to_object(
+            [o for o in context.selected_objects if o != obj],
+            obj,
+            self.move
+        )
+        
+        return {'FINISHED'}
+
+class AlignToVerticesOperator(bpy.types.Operator):
+    """Align selected objects to selected vertices of the active object"""
+    bl_idname = "align.align_to_vertices"
+    bl_label = "to vertices"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    source: bpy.props.EnumProperty(
+        name = "Source",
+        items = [
+            ('TRIPLE', "Triple", "Three vertices selected vertex by vertex (start, center, end)"),
+            ('PLANE', "Best Fit Plane", "Plane fitted to any number of selected vertices")
+        ],
+        default = 'TRIPLE',
+        description = "How the orientation is computed from the selected vertices"
+    )
+    
+    inverse: bpy.props.BoolProperty(
+        name = "Inverse",
+        default = False,
+        description = "Inverse the alignment of the Z-axis"
+    )
+    
+    move: bpy.props.BoolProperty(
+        name = "Move",
+        default = True,
+        description = "Move the object to selected vertices"
+    )
+    
+    batch: bpy.props.BoolProperty(
+        name = "Batch",
+        default = False,
+        description = "Align each selected object (sorted by name) to its own triple of the selected vertices (in selection order)"
+    )
+    
+    live: bpy.props.BoolProperty(
+        name = "Live",
+        default = False,
+        description = "Keep the objects aligned when the selected vertices are moved"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.active_object is not None and
+            context.active_object.type == 'MESH' and (
+                len(context.selected_objects) > 1 or (
+                    len(context.selected_objects) == 1 and
+                    not context.active_object.select_get()
+                )
+            )
+        )
+        
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        error_msg = ""
+        
+        obj = context.active_object
+        
+        # Get objects to align
+        objs = sorted(
+            (o for o in context.selected_objects if o != obj),
+            key = lambda o: o.name
+        )
+        triples = len(objs) if self.batch else 1
+        
+        if(self.source == 'PLANE'):
+            # One frame fitted to all selected vertices (no batch, no live)
+            plane = geometry.selected_plane(obj, self.inverse)
+            if(plane is None):
+                error_msg = "Please make sure that you have selected at least three vertices from the active object."
+            else:
+                center, matrix = plane
+                geometry.align_objects_to_frames(objs, matrix, center if self.move else None)
+                from . import live
+                live.unlink(objs)
+            
+            if(error_msg == ""):
+                return {'FINISHED'}
+            
+            self.report({'ERROR'}, error_msg)
+            return {'CANCELLED'}
+        
+        # Get orientation matrices (without switching the mode)
+        indices, coords = geometry.selected_vertices(obj)
+        
+        if(len(coords) != 3 * triples):
+            if(self.batch):
+                error_msg = "Please make sure that you have selected exactly three vertices per selected object from the active object (manually vertex by vertex)."
+            else:
+                error_msg = "Please make sure that you have selected exactly three vertices from the active object (manually vertex by vertex)."
+        else:
+            # Align objects
+            matrices, centers = geometry.vertex_frames(coords, self.inverse)
+            geometry.align_objects_to_frames(
+                objs,
+                matrices,
+                centers if self.move else None
+            )
+            
+            # Link or unlink the objects to their vertices
+            from . import live
+            if(self.live):
+                triples = [indices[3 * (k if self.batch else 0):][:3] for k in range(len(objs))]
+                live.link(objs, obj, triples, self.inverse, self.move)
+            else:
+                live.unlink(objs)
+        
+        if(error_msg == ""):
+            return {'FINISHED'}
+        
+        self.report({'ERROR'}, error_msg)
+        return {'CANCELLED'}
+
+class InstancesToVerticesOperator(bpy.types.Operator):
+    """Write a frame for every three selected vertices of the active object into an instance carrier"""
+    bl_idname = "align.instances_to_vertices"
+    bl_label = "instances to vertices"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    inverse: bpy.props.BoolProperty(
+        name = "Inverse",
+        default = False,
+        description = "Inverse the alignment of the Z-axis"
+    )
+    
+    carrier: bpy.props.StringProperty(
+        name = "Carrier",
+        default = "Align Instances",
+        description = "Name of the object holding the instance points (only an instance carrier of this name is overwritten, another object of this name is an error)"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.active_object is not None and
+            context.active_object.type == 'MESH'
+        )
+    
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        obj = context.active_object
+        
+        # Get orientation matrices (without switching the mode)
+        coords = geometry.selected_coordinates(obj)
+        if(len(coords) == 0 or len(coords) % 3 != 0):
+            self.report({'ERROR'}, "Please make sure that you have selected three vertices per instance from the active object (manually vertex by vertex).")
+            return {'CANCELLED'}
+        if(obj.name == self.carrier):
+            self.report({'ERROR'}, "The active object can not be the carrier.")
+            return {'CANCELLED'}
+        
+        matrices, centers = geometry.vertex_frames(coords, self.inverse)
+        carrier = geometry.write_instances(self.carrier, matrices, centers)
+        if(type(carrier) is not bpy.types.Object):
+            self.report({'ERROR'}, carrier)
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, "%d instances written to '%s'." % (len(matrices), self.carrier))
+        return {'FINISHED'}
+
+class AlignCollectionsOperator(bpy.types.Operator):
+    """Align the objects of one collection to their counterparts (by name or property) in another collection"""
+    bl_idname = "align.align_collections"
+    bl_label = "collection to collection"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    source: bpy.props.StringProperty(
+        name = "Objects",
+        default = "",
+        description = "Collection with the objects to align"
+    )
+    
+    target: bpy.props.StringProperty(
+        name = "Targets",
+        default = "",
+        description = "Collection with the objects to align to (e.g. empties)"
+    )
+    
+    key: bpy.props.EnumProperty(
+        name = "Match",
+        items = [
+            ('NAME', "Name", "Same name (without the number of copies like '.001')"),
+            ('PROPERTY', "Property", "Same value of a custom property")
+        ],
+        default = 'NAME',
+        description = "How objects and targets are paired"
+    )
+    
+    prop: bpy.props.StringProperty(
+        name = "Property",
+        default = "align_id",
+        description = "Custom property pairing objects and targets"
+    )
+    
+    move: bpy.props.BoolProperty(
+        name = "Move",
+        default = True,
+        description = "Move the objects to their targets"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return len(bpy.data.collections) > 0
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop_search(self, "source", bpy.data, "collections")
+        layout.prop_search(self, "target", bpy.data, "collections")
+        layout.prop(self, "key")
+        if(self.key == 'PROPERTY'):
+            layout.prop(self, "prop")
+        layout.prop(self, "move")
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+    
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        source = bpy.data.collections.get(self.source)
+        target = bpy.data.collections.get(self.target)
+        if(source is None or target is None or source == target):
+            self.report({'ERROR'}, "Please select two different collections.")
+            return {'CANCELLED'}
+        
+        count, missing = geometry.align_pairs(
+            sorted(source.all_objects, key = lambda o: o.name),
+            sorted(target.all_objects, key = lambda o: o.name),
+            self.prop if self.key == 'PROPERTY' else None,
+            self.move
+        )
+        
+        if(missing):
+            self.report({'WARNING'}, "%d objects aligned, no target for: %s" % (count, ", ".join(missing)))
+        else:
+            self.report({'INFO'}, "%d objects aligned." % count)
+        return {'FINISHED'}
+
+class SetReferenceOperator(bpy.types.Operator):
+    """Store the selected vertices of the active object as its reference triple"""
+    bl_idname = "align.set_reference"
+    bl_label = "set reference"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.active_object is not None and
+            context.active_object.type == 'MESH'
+        )
+    
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        if(not geometry.set_reference(context.active_object)):
+            self.report({'ERROR'}, "Please make sure that you have selected exactly three vertices from the active object (manually vertex by vertex).")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+class AutoAlignOperator(bpy.types.Operator):
+    """Align selected objects by finding their reference triples on the active object"""
+    bl_idname = "align.auto_align"
+    bl_label = "auto to vertices"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    move: bpy.props.BoolProperty(
+        name = "Move",
+        default = True,
+        description = "Move the objects to the found vertices"
+    )
+    tolerance: bpy.props.FloatProperty(
+        name = "Tolerance",
+        default = 0.001,
+        min = 1e-6,
+        max = 0.1,
+        precision = 4,
+        description = "Allowed difference of the distances (relative to the mean edge length) and of the angle (in radians)"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.active_object is not None and
+            context.active_object.type == 'MESH' and
+            context.active_object.mode == 'OBJECT' and (
+                len(context.selected_objects) > 1 or (
+                    len(context.selected_objects) == 1 and
+                    not context.active_object.select_get()
+                )
+            )
+        )
+    
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        obj = context.active_object
+        missing = geometry.auto_align(
+            sorted((o for o in context.selected_objects if o != obj), key = lambda o: o.name),
+            obj,
+            self.move,
+            self.tolerance
+        )
+        
+        if(missing):
+            self.report({'WARNING'}, "No matching vertices found for: " + ", ".join(missing))
+        return {'FINISHED'}
+
+class AlignToSurfaceOperator(bpy.types.Operator):
+    """Align selected objects to the nearest point on the surface of the active object"""
+    bl_idname = "align.align_to_surface"
+    bl_label = "to surface"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    move: bpy.props.BoolProperty(
+        name = "Move",
+        default = True,
+        description = "Move the object to the nearest point on the surface"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.active_object is not None and
+            context.active_object.type == 'MESH' and
+            context.active_object.mode == 'OBJECT' and (
+                len(context.selected_objects) > 1 or (
+                    len(context.selected_objects) == 1 and
+                    not context.active_object.select_get()
+                )
+            )
+        )
+    
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        obj = context.active_object
+        geometry.align_to_surface(
+            [o for o in context.selected_objects if o != obj],
+            obj,
+            self.move
+        )
+        return {'FINISHED'}
+
+class AlignToCurveOperator(bpy.types.Operator):
+    """Align selected objects to the curve"""
+    bl_idname = "align.align_to_curve"
+    bl_label = "to curve"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    move: bpy.props.FloatProperty(
+        name = "Move",
+        default = 0,
+        description = "Move the object along the curve"
+    )
+    
+    spacing: bpy.props.FloatProperty(
+        name = "Spacing",
+        default = 0,
+        description = "Distance along the curve between the selected objects (sorted by name)"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.active_object is not None and
+            context.active_object.type == 'CURVE' and (
+                len(context.selected_objects) > 1 or (
+                    len(context.selected_objects) == 1 and
+                    not context.active_object.select_get()
+                )
+            )
+        )
+    
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        obj = context.active_object
+        
+        # Get objects to align
+        objs = sorted(
+            (o for o in context.selected_objects if o != obj),
+            key = lambda o: o.name
+        )
+        
+        msg = geometry.align_to_curve(objs, obj, self.move, self.spacing)
+        if(msg):
+            self.report({'ERROR'}, msg)
+            return {'CANCELLED'}
+        
+        return {'FINISHED'}
+    
+class SavePresetOperator(bpy.types.Operator):
+    """Save the orientation of the selected vertices of the active object as preset"""
+    bl_idname = "align.save_preset"
+    bl_label = "save preset"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    name: bpy.props.StringProperty(
+        name = "Name",
+        default = "Preset",
+        description = "Name of the preset (an existing preset is overwritten)"
+    )
+    
+    inverse: bpy.props.BoolProperty(
+        name = "Inverse",
+        default = False,
+        description = "Inverse the alignment of the Z-axis"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.active_object is not None and
+            context.active_object.type == 'MESH'
+        )
+    
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        props = context.scene.align
+        preset = geometry.save_preset(props.presets, self.name, context.active_object, self.inverse)
+        
+        if(preset is None):
+            self.report({'ERROR'}, "Please make sure that you have selected exactly three vertices from the active object (manually vertex by vertex).")
+            return {'CANCELLED'}
+        
+        props.preset_index = props.presets.find(preset.name)
+        return {'FINISHED'}
+
+class ApplyPresetOperator(bpy.types.Operator):
+    """Align selected objects to the active preset"""
+    bl_idname = "align.apply_preset"
+    bl_label = "apply preset"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    move: bpy.props.BoolProperty(
+        name = "Move",
+        default = True,
+        description = "Move the objects to the origin of the preset"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        props = context.scene.align
+        return (
+            0 <= props.preset_index < len(props.presets) and
+            len(context.selected_objects) > 0
+        )
+    
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        props = context.scene.align
+        geometry.apply_preset(
+            list(context.selected_objects),
+            props.presets[props.preset_index],
+            self.move
+        )
+        return {'FINISHED'}
+
+class RemovePresetOperator(bpy.types.Operator):
+    """Remove the active preset"""
+    bl_idname = "align.remove_preset"
+    bl_label = "remove preset"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        props = context.scene.align
+        return 0 <= props.preset_index < len(props.presets)
+    
+    def execute(self, context):
+        props = context.scene.align
+        props.presets.remove(props.preset_index)
+        props.preset_index = max(0, min(props.preset_index, len(props.presets) - 1))
+        return {'FINISHED'}
+    
+class AngleOperator:
+    """Base of the operators creating angles from the profile (mixin)"""
+    
+    # Seconds of work per timer event when running modal
+    chunk_time = 0.05
+    
+    # Events passed through to the view when running modal (navigation)
+    view_events = {
+        'MOUSEMOVE', 'INBETWEENMOUSEMOVE', 'MIDDLEMOUSE',
+        'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'WHEELINMOUSE', 'WHEELOUTMOUSE',
+        'TRACKPADPAN', 'TRACKPADZOOM',
+        'NUMPAD_0', 'NUMPAD_1', 'NUMPAD_2', 'NUMPAD_3', 'NUMPAD_4',
+        'NUMPAD_5', 'NUMPAD_6', 'NUMPAD_7', 'NUMPAD_8', 'NUMPAD_9',
+        'NUMPAD_PERIOD', 'NUMPAD_PLUS', 'NUMPAD_MINUS'
+    }
+    
+    # Properties
+    linked: bpy.props.BoolProperty(
+        name = "Linked",
+        default = True,
+        description = "Reuse the mesh of identical angles (linked data)"
+    )
+    
+    # Methods
+    def start(self, context):
+        from . import geometry
+        
+        self.profile = getattr(context.scene.align, self.profile_prop)
+        
+        # Reuse the meshes of deleted angles
+        geometry.release_orphans()
+        
+        # Set mode
+        if(context.active_object is not None):
+            bpy.ops.object.mode_set(mode='OBJECT')
+        
+        self.msgs = []
+        self.agls = []
+        self.objs = list(context.selected_objects)
+        self.index = 0
+        bpy.ops.object.select_all(action = 'DESELECT')
+    
+    def step(self):
+        from . import geometry
+        
+        add_angle = getattr(geometry, self.add_angle)
+        result = add_angle(self.objs[self.index], self.profile, self.linked)
+        if(type(result) is bpy.types.Object):
+            self.agls.append(result)
+        else:
+            self.msgs.append(result)
+        self.index += 1
+    
+    def finish(self):
+        from . import geometry
+        
+        end_record(getattr(self, 'record', None))
+        geometry.clear_mesh_pool()
+        if(self.msgs):
+            self.report({'WARNING'}, "\n".join(self.msgs))
+        return {'FINISHED'}
+    
+    def rollback(self):
+        from . import geometry
+        
+        for obj in self.agls:
+            mesh = obj.data
+            bpy.data.objects.remove(obj)
+            geometry.release_mesh(mesh)
+        self.agls = []
+        geometry.clear_mesh_pool()
+        end_record(getattr(self, 'record', None))
+    
+    @profiled
+    def execute(self, context):
+        self.start(context)
+        while(self.index < len(self.objs)):
+            self.step()
+        return self.finish()
+    
+    def invoke(self, context, event):
+        # The modal run is recorded as a whole, not only execute
+        self.record = begin_record(self.bl_idname)
+        try:
+            self.start(context)
+        except Exception:
+            end_record(self.record)
+            raise
+        wm = context.window_manager
+        wm.progress_begin(0, len(self.objs))
+        self.timer = wm.event_timer_add(0.01, window = context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def stop(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+    
+    def modal(self, context, event):
+        wm = context.window_manager
+        
+        # Cancel and remove the angles created so far
+        if(event.type == 'ESC'):
+            self.stop(context)
+            self.rollback()
+            self.report({'INFO'}, "Cancelled")
+            return {'CANCELLED'}
+        
+        # Only navigate the view while the angles are created. Undo and
+        # editing would invalidate the objects held by the operator.
+        if(event.type != 'TIMER'):
+            if(event.type in self.view_events or event.type.startswith('NDOF_')):
+                return {'PASS_THROUGH'}
+            return {'RUNNING_MODAL'}
+        
+        # Create angles until the time slice is used up
+        try:
+            end = time.perf_counter() + self.chunk_time
+            while(self.index < len(self.objs) and time.perf_counter() < end):
+                self.step()
+        except Exception as error:
+            self.stop(context)
+            self.rollback()
+            self.report({'ERROR'}, "Creating the angles failed: " + str(error))
+            return {'CANCELLED'}
+        wm.progress_update(self.index)
+        
+        if(self.index < len(self.objs)):
+            return {'RUNNING_MODAL'}
+        
+        self.stop(context)
+        return self.finish()
+    
+class AngleFromMeshOperator(AngleOperator, bpy.types.Operator):
+    """Create an angle from a mesh at the selected vertices of each selected object"""
+    bl_idname = "align.angle_from_mesh"
+    bl_label = "from mesh"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    profile_prop = "mesh_profile"
+    add_angle = "add_angle_from_mesh"
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return context.scene.align.mesh_profile is not None
+    
+class AngleFromCurveOperator(AngleOperator, bpy.types.Operator):
+    """Create an angle from a curve at the selected vertices of each selected object"""
+    bl_idname = "align.angle_from_curve"
+    bl_label = "from curve"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    profile_prop = "curve_profile"
+    add_angle = "add_angle_from_curve"
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return context.scene.align.curve_profile is not None
+    
+class SweepOperator:
+    """Base of the operators sweeping the profile along edge paths (mixin)"""
+    
+    # Methods
+    @profiled
+    def execute(self, context):
+        from . import geometry
+        
+        profile = getattr(context.scene.align, self.profile_prop)
+        add_sweep = getattr(geometry, self.add_sweep)
+        geometry.release_orphans()
+        
+        msgs = []
+        parts = []
+        for obj in context.selected_objects:
+            result = add_sweep(obj, profile)
+            if(type(result) is bpy.types.Object):
+                parts.append(result)
+            else:
+                msgs.append(result)
+        
+        # Select the sweeps
+        if(parts):
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            for part in parts:
+                part.select_set(True)
+        geometry.clear_mesh_pool()
+        
+        if(msgs):
+            self.report({'WARNING'}, "\n".join(msgs))
+        return {'FINISHED'}
+    
+class SweepFromMeshOperator(SweepOperator, bpy.types.Operator):
+    """Sweep a mesh along the selected edge path of each selected object"""
+    bl_idname = "align.sweep_from_mesh"
+    bl_label = "sweep"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    profile_prop = "mesh_profile"
+    add_sweep = "add_sweep_from_mesh"
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return context.scene.align.mesh_profile is not None
+    
+class SweepFromCurveOperator(SweepOperator, bpy.types.Operator):
+    """Sweep a curve along the selected edge path of each selected object"""
+    bl_idname = "align.sweep_from_curve"
+    bl_label = "sweep"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    profile_prop = "curve_profile"
+    add_sweep = "add_sweep_from_curve"
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return context.scene.align.curve_profile is not None
+    
+class CopyMeshToSelectedOperator(bpy.types.Operator):
+    """Copy the mesh of the active object to all selected objects."""
+    bl_idname = "align.copy_mesh_to_selected"
+    bl_label = "copy mesh to selected"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.active_object is not None and
+            context.active_object.type == 'MESH' and (
+                len(context.selected_objects) > 1 or (
+                    len(context.selected_objects) == 1 and
+                    not context.active_object.select_get()
+                )
+            )
+        )
+    
+    @profiled
+    def execute(self, context):
+        for obj in context.selected_objects:
+            if(
+                obj != context.active_object and
+                type(obj) is bpy.types.Object and
+                obj.type == 'MESH'
+            ):
+                obj.data = context.active_object.data
+                
+        return {'FINISHED'}
+
+class BatchOperator(bpy.types.Operator):
+    """Run the align and angle jobs of a text (JSON) as one undo step"""
+    bl_idname = "align.batch"
+    bl_label = "run batch"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    text: bpy.props.StringProperty(
+        name = "Text",
+        default = "",
+        description = "Text with the list of jobs as JSON (see batch.py)"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return len(bpy.data.texts) > 0
+    
+    def draw(self, context):
+        self.layout.prop_search(self, "text", bpy.data, "texts")
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+    
+    @profiled
+    def execute(self, context):
+        import json
+        from . import batch
+        
+        text = bpy.data.texts.get(self.text)
+        if(text is None):
+            self.report({'ERROR'}, "Please select the text with the jobs.")
+            return {'CANCELLED'}
+        try:
+            jobs = json.loads(text.as_string())
+        except ValueError as error:
+            self.report({'ERROR'}, "The jobs are no valid JSON: " + str(error))
+            return {'CANCELLED'}
+        
+        # The operator pushes the only undo step
+        with batch.session(context, undo = False):
+            msgs = batch.run_jobs(jobs)
+        
+        if(msgs):
+            self.report({'WARNING'}, "\n".join(msgs))
+        return {'FINISHED'}
+
+class DeduplicateMeshesOperator(bpy.types.Operator):
+    """Link all objects with identical geometry to one shared mesh."""
+    bl_idname = "align.deduplicate_meshes"
+    bl_label = "deduplicate meshes"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    # Properties
+    scope: bpy.props.EnumProperty(
+        name = "Scope",
+        items = [
+            ('SELECTED', "Selected", "Only the selected objects"),
+            ('SCENE', "Scene", "All objects of the scene")
+        ],
+        default = 'SELECTED',
+        description = "Objects to deduplicate"
+    )
+    
+    epsilon: bpy.props.FloatProperty(
+        name = "Epsilon",
+        default = 0.0001,
+        min = 0,
+        precision = 5,
+        description = "Vertices closer than this are treated as identical"
+    )
+    
+    purge: bpy.props.BoolProperty(
+        name = "Purge",
+        default = True,
+        description = "Remove the meshes that are no longer used"
+    )
+    
+    # Methods
+    @profiled
+    def execute(self, context):
+        if(self.scope == 'SCENE'):
+            objs = context.scene.objects
+        else:
+            objs = context.selected_objects
+        
+        from . import geometry
+        
+        count = geometry.deduplicate_meshes(objs, self.epsilon, self.purge)
+        self.report({'INFO'}, "%d objects linked to shared meshes" % count)
+        return {'FINISHED'}
+    
+class ExportStatsOperator(bpy.types.Operator):
+    """Export the stats as CSV or JSON file."""
+    bl_idname = "align.export_stats"
+    bl_label = "export stats"
+    
+    # Properties
+    filepath: bpy.props.StringProperty(
+        name = "File Path",
+        default = "align_stats.json",
+        subtype = 'FILE_PATH',
+        description = "File to write the stats to (.csv or .json)"
+    )
+    
+    # Methods
+    @classmethod
+    def poll(cls, context):
+        return len(stats) > 0
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        export_stats(bpy.path.abspath(self.filepath))
+        return {'FINISHED'}
+
+class ClearStatsOperator(bpy.types.Operator):
+    """Clear the stats."""
+    bl_idname = "align.clear_stats"
+    bl_label = "clear stats"
+    
+    # Methods
+    def execute(self, context):
+        stats.clear()
+        return {'FINISHED'}
@@ -0,0 +1,136 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#              Panels             #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import bpy
+from .stats import stats_summary
+from .operators import (
+    SetOrientationToObjectOperator,
+    SetOrientationToVerticesOperator,
+    AlignToOrientationOperator,
+    AlignToObjectOperator,
+    AlignCollectionsOperator,
+    AlignToVerticesOperator,
+    InstancesToVerticesOperator,
+    SetReferenceOperator,
+    AutoAlignOperator,
+    AlignToSurfaceOperator,
+    AlignToCurveOperator,
+    SavePresetOperator,
+    ApplyPresetOperator,
+    RemovePresetOperator,
+    AngleFromMeshOperator,
+    AngleFromCurveOperator,
+    SweepFromMeshOperator,
+    SweepFromCurveOperator,
+    CopyMeshToSelectedOperator,
+    BatchOperator,
+    DeduplicateMeshesOperator,
+    ExportStatsOperator,
+    ClearStatsOperator
+)
+
+# # # # # # # # # # # # # # # # # #
+#              Panels             #
+# # # # # # # # # # # # # # # # # #
+
+class OrientationPanel(bpy.types.Panel):
+    bl_idname = "OBJECT_PT_orientation"
+    bl_label = "Orientation"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Align"
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="Orientation:")
+        layout.operator(SetOrientationToObjectOperator.bl_idname)
+        layout.operator(SetOrientationToVerticesOperator.bl_idname)
+        layout.label(text="Align:")
+        layout.operator(AlignToOrientationOperator.bl_idname)
+        layout.operator(AlignToObjectOperator.bl_idname)
+        layout.operator(AlignCollectionsOperator.bl_idname)
+        layout.operator(AlignToVerticesOperator.bl_idname)
+        layout.operator(InstancesToVerticesOperator.bl_idname)
+        row = layout.row()
+        row.operator(AutoAlignOperator.bl_idname)
+        row.operator(SetReferenceOperator.bl_idname)
+        layout.operator(AlignToSurfaceOperator.bl_idname)
+        layout.operator(AlignToCurveOperator.bl_idname)
+
+class PresetPanel(bpy.types.Panel):
+    bl_idname = "OBJECT_PT_presets"
+    bl_label = "Presets"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Align"
+    
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.align
+        layout.template_list("UI_UL_list", "align_presets", props, "presets", props, "preset_index")
+        row = layout.row()
+        row.operator(SavePresetOperator.bl_idname)
+        row.operator(RemovePresetOperator.bl_idname)
+        layout.operator(ApplyPresetOperator.bl_idname)
+
+class AnglePanel(bpy.types.Panel):
+    bl_idname = "OBJECT_PT_angle"
+    bl_label = "Angle"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Align"
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="Create angle")
+        box = layout.box()
+        box.prop(context.scene.align, "mesh_profile", text="Profile")
+        row = box.row()
+        row.operator(AngleFromMeshOperator.bl_idname)
+        row.operator(SweepFromMeshOperator.bl_idname)
+        box = layout.box()
+        box.prop(context.scene.align, "curve_profile", text="Profile")
+        row = box.row()
+        row.operator(AngleFromCurveOperator.bl_idname)
+        row.operator(SweepFromCurveOperator.bl_idname)
+        
+class OtherPanel(bpy.types.Panel):
+    bl_idname = "OBJECT_PT_other"
+    bl_label = "Other"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Align"
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.operator(CopyMeshToSelectedOperator.bl_idname)
+        layout.operator(DeduplicateMeshesOperator.bl_idname)
+        layout.operator(BatchOperator.bl_idname)
+    
+class StatsPanel(bpy.types.Panel):
+    bl_idname = "OBJECT_PT_stats"
+    bl_label = "Stats"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Align"
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(context.scene.align, "profiling")
+        for entry in stats_summary():
+            box = layout.box()
+            box.label(text = "%s (%dx)" % (entry['name'], entry['calls']))
+            box.label(text = "%.1f ms, %.1f ms per call" % (entry['time'] * 1000, entry['time'] * 1000 / entry['calls']))
+            box.label(text = "%d objects, %d vertices" % (entry['objects'], entry['vertices']))
+            box.label(text = "%d mode switches, %d bpy.ops calls" % (entry['mode_switches'], entry['ops']))
+        row = layout.row()
+        row.operator(ExportStatsOperator.bl_idname)
+        row.operator(ClearStatsOperator.bl_idname)
@@ -0,0 +1,103 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#            Properties           #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import bpy
+
+# # # # # # # # # # # # # # # # # #
+#            Properties           #
+# # # # # # # # # # # # # # # # # #
+
+class AlignPreset(bpy.types.PropertyGroup):
+    # Orientation (global, axes as columns)
+    matrix: bpy.props.FloatVectorProperty(
+        name = "Matrix",
+        size = 9,
+        subtype = 'MATRIX',
+        description = "The orientation of the preset"
+    )
+    # Origin (global)
+    origin: bpy.props.FloatVectorProperty(
+        name = "Origin",
+        size = 3,
+        subtype = 'TRANSLATION',
+        description = "The center vertex of the preset"
+    )
+    # Source
+    source: bpy.props.PointerProperty(
+        type = bpy.types.Object,
+        name = "Source",
+        description = "The object the preset was computed from"
+    )
+    indices: bpy.props.IntVectorProperty(
+        name = "Vertices",
+        size = 3,
+        default = (-1, -1, -1),
+        description = "The vertices (start, center, end) the preset was computed from"
+    )
+    inverse: bpy.props.BoolProperty(
+        name = "Inverse",
+        default = False,
+        description = "The Z-axis of the preset is inversed"
+    )
+
+class AlignLink(bpy.types.PropertyGroup):
+    # Source of the live alignment (see live.py)
+    source: bpy.props.PointerProperty(
+        type = bpy.types.Object,
+        name = "Source",
+        description = "The object this object is aligned to live"
+    )
+    indices: bpy.props.IntVectorProperty(
+        name = "Vertices",
+        size = 3,
+        default = (-1, -1, -1),
+        description = "The vertices (start, center, end) this object is aligned to"
+    )
+    inverse: bpy.props.BoolProperty(
+        name = "Inverse",
+        default = False,
+        description = "Inverse the alignment of the Z-axis"
+    )
+    move: bpy.props.BoolProperty(
+        name = "Move",
+        default = True,
+        description = "Move the object to the center vertex"
+    )
+
+class AlignProps(bpy.types.PropertyGroup):
+    # Profile (Mesh)
+    mesh_profile: bpy.props.PointerProperty(
+        type = bpy.types.Mesh,
+        name = "Mesh",
+        description = "The profile to be used for the angles"
+    )
+    # Profile (Curve)
+    curve_profile: bpy.props.PointerProperty(
+        type = bpy.types.Curve,
+        name = "Curve",
+        description = "The profile to be used for the angles"
+    )
+    # Profiling
+    profiling: bpy.props.BoolProperty(
+        name = "Profiling",
+        default = False,
+        description = "Record the time of every operator in the stats"
+    )
+    # Orientation presets
+    presets: bpy.props.CollectionProperty(
+        type = AlignPreset,
+        name = "Presets",
+        description = "Saved orientations"
+    )
+    preset_index: bpy.props.IntProperty(
+        name = "Preset",
+        default = 0,
+        min = 0
+    )
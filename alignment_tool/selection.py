@@ -0,0 +1,123 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#            Selection            #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Reading the ordered vertex selection without switching modes.
+
+Blender keeps the selection order only in edit mode and converting a mesh
+to a BMesh takes seconds for huge meshes. So the selection order is
+recorded on the mesh (see record_select_history) while the mesh is edited
+and read back in object mode after a cheap check that it is still valid.
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import bpy
+import bmesh
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+# Names of the custom properties holding the recorded selection order
+HISTORY_INDICES = "align_select_history"
+HISTORY_COORDS = "align_select_coords"
+
+
+def edit_select_history(obj):
+    """
+    Returns the indices and local coordinates of the selected vertices of
+    the edit mesh of obj in selection order.
+
+    The indices are updated first, since they are stale in edit mode after
+    vertices were added or removed.
+    """
+    bm = bmesh.from_edit_mesh(obj.data)
+    bm.verts.index_update()
+    verts = [v for v in bm.select_history if isinstance(v, bmesh.types.BMVert)]
+    return [v.index for v in verts], [tuple(v.co) for v in verts]
+
+
+def record_select_history(obj):
+    """
+    Stores the selection order of the edit mesh of obj on its mesh.
+    """
+    indices, coords = edit_select_history(obj)
+    coords = [c for co in coords for c in co]
+    mesh = obj.data
+    if(list(mesh.get(HISTORY_INDICES, [])) == indices and list(mesh.get(HISTORY_COORDS, [])) == coords):
+        return
+    if(indices):
+        mesh[HISTORY_INDICES] = indices
+        mesh[HISTORY_COORDS] = coords
+    else:
+        mesh.pop(HISTORY_INDICES, None)
+        mesh.pop(HISTORY_COORDS, None)
+
+
+def recorded_select_history(mesh):
+    """
+    Returns the indices and local coordinates of the recorded selection
+    order or None.
+
+    The record is only used if exactly these vertices are still selected and
+    did not move, which costs O(1) per vertex instead of O(n) for the mesh.
+    """
+    indices = list(mesh.get(HISTORY_INDICES, []))
+    coords = list(mesh.get(HISTORY_COORDS, []))
+    if(not indices or mesh.total_vert_sel != len(indices) or len(coords) != 3 * len(indices)):
+        return None
+    result = []
+    for k, i in enumerate(indices):
+        if(i < 0 or i >= len(mesh.vertices)):
+            return None
+        vertex = mesh.vertices[i]
+        co = tuple(vertex.co)
+        if(not vertex.select or any(abs(a - b) > 1e-6 for a, b in zip(co, coords[3 * k:3 * k + 3]))):
+            return None
+        result.append(co)
+    return indices, result
+
+
+def select_history(obj):
+    """
+    Returns the indices and local coordinates of the selected vertices of
+    the mesh object obj in selection order, without switching the mode.
+
+    In edit mode the edit mesh is read directly. In object mode the recorded
+    selection order is used if it is still valid, otherwise the mesh is
+    converted to a BMesh once (which also reads the selection order).
+    """
+    if(obj.mode == 'EDIT'):
+        record_select_history(obj)
+        return edit_select_history(obj)
+    
+    history = recorded_select_history(obj.data)
+    if(history is not None):
+        return history
+    
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    bm.verts.index_update()
+    verts = [v for v in bm.select_history if isinstance(v, bmesh.types.BMVert)]
+    history = [v.index for v in verts], [tuple(v.co) for v in verts]
+    bm.free()
+    return history
+
+
+@bpy.app.handlers.persistent
+def select_history_update(scene, depsgraph):
+    """
+    Records the selection order of all meshes in edit mode.
+    """
+    if(bpy.context.mode != 'EDIT_MESH'):
+        return
+    for obj in getattr(bpy.context, 'objects_in_mode', []):
+        if(obj.type == 'MESH'):
+            record_select_history(obj)
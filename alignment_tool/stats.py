@@ -0,0 +1,150 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#              Stats              #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Opt-in profiling of the operators (see StatsPanel).
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import bpy
+import csv
+import functools
+import json
+import os
+import sys
+import time
+from collections import deque
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+# Maximum number of records kept in the stats (ring buffer)
+STATS_SIZE = 1000
+
+# Records of the profiled calls, oldest first
+stats = deque(maxlen = STATS_SIZE)
+
+# Records of the profiled calls that are currently running
+stats_running = []
+
+
+def stats_enabled():
+    """
+    Returns True if profiling is enabled in the current scene.
+    """
+    scene = getattr(bpy.context, "scene", None)
+    return scene is not None and scene.align.profiling
+
+
+def count_ops(frame, event, arg):
+    """
+    Profile hook counting the bpy.ops calls of all running records.
+    """
+    if(
+        event == 'call' and
+        frame.f_code.co_name == '__call__' and
+        frame.f_code.co_filename.endswith(os.path.join('bpy', 'ops.py'))
+    ):
+        op = frame.f_locals.get('self')
+        name = '%s.%s' % (getattr(op, '_module', ''), getattr(op, '_func', ''))
+        for record in stats_running:
+            record['ops'] += 1
+            if(name == 'object.mode_set'):
+                record['mode_switches'] += 1
+
+
+def begin_record(name):
+    """
+    Starts a record of the given name and returns it, or None if profiling
+    is disabled. Used by profiled and by modal operators, whose run spans
+    several calls.
+    """
+    if(not stats_enabled()):
+        return None
+    objs = getattr(bpy.context, 'selected_objects', None) or []
+    record = {
+        'name': name,
+        'time': time.perf_counter(),    # start time until the record ends
+        'objects': len(objs),
+        'vertices': sum(len(o.data.vertices) for o in objs if o.type == 'MESH'),
+        'mode_switches': 0,
+        'ops': 0
+    }
+    if(not stats_running):
+        sys.setprofile(count_ops)
+    stats_running.append(record)
+    return record
+
+
+def end_record(record):
+    """
+    Ends a record started by begin_record and adds it to the stats.
+    """
+    running = [k for k, r in enumerate(stats_running) if r is record]
+    if(not running):
+        return
+    record['time'] = time.perf_counter() - record['time']
+    del stats_running[running[0]]
+    if(not stats_running):
+        sys.setprofile(None)
+    stats.append(record)
+
+
+def profiled(function):
+    """
+    Decorator recording wall time, object and vertex counts, mode switches
+    and bpy.ops calls of a call in the stats, if profiling is enabled.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        # Operators are recorded by their idname
+        name = getattr(args[0], 'bl_idname', function.__qualname__) if args else function.__qualname__
+        record = begin_record(name)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            end_record(record)
+    return wrapper
+
+
+def stats_summary():
+    """
+    Returns the stats summed up per name as list of dicts, slowest first.
+    """
+    summary = {}
+    for record in stats:
+        entry = summary.setdefault(record['name'], {
+            'name': record['name'],
+            'calls': 0,
+            'time': 0.0,
+            'objects': 0,
+            'vertices': 0,
+            'mode_switches': 0,
+            'ops': 0
+        })
+        entry['calls'] += 1
+        for key in ('time', 'objects', 'vertices', 'mode_switches', 'ops'):
+            entry[key] += record[key]
+    return sorted(summary.values(), key = lambda e: -e['time'])
+
+
+def export_stats(filepath):
+    """
+    Writes the records of the stats to a CSV (.csv) or JSON file.
+    """
+    fields = ['name', 'time', 'objects', 'vertices', 'mode_switches', 'ops']
+    with open(filepath, 'w', newline = '') as file:
+        if(filepath.lower().endswith('.csv')):
+            writer = csv.DictWriter(file, fieldnames = fields)
+            writer.writeheader()
+            writer.writerows(stats)
+        else:
+            json.dump(list(stats), file, indent = 2)
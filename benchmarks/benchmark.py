@@ -0,0 +1,247 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#           Benchmarks            #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+Benchmarks of the geometry of the Alignment Tool.
+
+The benchmarks run on plain CPython against alignment_tool.core, which holds
+the math behind AlignToVerticesOperator (orientation_matrices) and the angle
+generation of add_angle (mitre_geometry), so Blender is not needed. The
+results are written as JSON. If a baseline is given, every benchmark that
+got slower than the tolerance allows is reported and the exit code is 1.
+
+Example:
+    python benchmarks/benchmark.py --output new.json --baseline old.json
+"""
+
+
+# # # # # # # # # # # # # # # # # #
+#             Imports             #
+# # # # # # # # # # # # # # # # # #
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alignment_tool.core import (
+    orientation_matrices, mitre_geometry, arc_length_table, path_frames,
+    plane_frame, polyline_profile, sweep_geometry, triple_index,
+    triple_signatures, find_triples
+)
+
+# # # # # # # # # # # # # # # # # #
+#            Functions            #
+# # # # # # # # # # # # # # # # # #
+
+def measure(function, repeat, min_time=0.2):
+    """
+    Returns the best time of one call in seconds.
+
+    The function is called in loops of growing size until a loop takes at
+    least min_time, then the fastest of repeat loops is taken.
+    """
+    number = 1
+    while(True):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if(elapsed >= min_time or number >= 1 << 20):
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def circle_profile(count):
+    """
+    Returns the arrays of a filled circle profile with count vertices.
+    """
+    t = np.linspace(0, 2 * math.pi, count, endpoint=False)
+    points = np.column_stack((np.cos(t), np.sin(t), np.zeros(count)))
+    return polyline_profile([(points, True)], True)
+
+
+def bench_frames(sizes, repeat):
+    """
+    Throughput of orientation_matrices for 1 to 100k vertex triples.
+    """
+    rng = np.random.default_rng(0)
+    results = {}
+    for size in sizes:
+        triples = rng.random((size, 3, 3))
+        inverse = rng.random(size) < 0.5
+        seconds = measure(lambda: orientation_matrices(triples, inverse), repeat)
+        results['frames/%d' % size] = {
+            'seconds': seconds,
+            'per_second': size / seconds
+        }
+    return results
+
+
+def bench_plane(sizes, repeat):
+    """
+    Throughput of plane_frame for 1k to 1M points in chunks of 65536.
+    """
+    rng = np.random.default_rng(0)
+    results = {}
+    for size in sizes:
+        points = rng.random((size, 3)).astype(np.float32)
+        chunks = lambda: (points[i:i + 65536] for i in range(0, size, 65536))
+        seconds = measure(lambda: plane_frame(chunks()), repeat)
+        results['plane/%d' % size] = {
+            'seconds': seconds,
+            'per_second': size / seconds
+        }
+    return results
+
+
+def bench_angles(sizes, repeat):
+    """
+    Time per angle of mitre_geometry for profiles with growing resolution.
+    """
+    results = {}
+    for size in sizes:
+        profile = circle_profile(size)
+        seconds = measure(lambda: mitre_geometry(*profile, math.pi / 2), repeat)
+        results['angle/%d' % size] = {
+            'seconds': seconds,
+            'per_second': 1 / seconds
+        }
+    return results
+
+
+def bench_sweep(sizes, repeat):
+    """
+    Time of sweep_geometry for a 64 vertex profile along 10 to 1000 segments.
+    """
+    profile = circle_profile(64)
+    results = {}
+    for size in sizes:
+        t = np.linspace(0, 4 * math.pi, size + 1)
+        points = np.column_stack((np.cos(t), np.sin(t), t / 10)) * 10
+        seconds = measure(lambda: sweep_geometry(*profile, points), repeat)
+        results['sweep/%d' % size] = {
+            'seconds': seconds,
+            'per_second': size / seconds
+        }
+    return results
+
+
+def bench_hashing(sizes, repeat):
+    """
+    Time of one triple lookup in the index of a grid mesh with 1k to 1M
+    vertices (the index is built once per size).
+    """
+    rng = np.random.default_rng(0)
+    results = {}
+    for size in sizes:
+        side = int(math.sqrt(size))
+        grid = np.stack(np.meshgrid(np.arange(side), np.arange(side)), -1).reshape(-1, 2)
+        coords = np.column_stack((grid + rng.random(grid.shape) * 0.3, rng.random(len(grid))))
+        ids = np.arange(side * side).reshape(side, side)
+        edges = np.concatenate((
+            np.column_stack((ids[:, :-1].ravel(), ids[:, 1:].ravel())),
+            np.column_stack((ids[:-1].ravel(), ids[1:].ravel()))
+        ))
+        index = triple_index(coords, edges)
+        signature = triple_signatures(coords[index['triples'][len(edges) // 2]])[0]
+        seconds = measure(lambda: find_triples(index, signature), repeat)
+        results['hashing/%d' % size] = {
+            'seconds': seconds,
+            'per_second': 1 / seconds
+        }
+    return results
+
+
+def bench_curve(sizes, repeat):
+    """
+    Throughput of path_frames for 1 to 100k objects along a curve.
+    """
+    t = np.linspace(0, 10 * math.pi, 10000)
+    points, lengths = arc_length_table(np.column_stack((np.cos(t), np.sin(t), t)))
+    results = {}
+    for size in sizes:
+        distances = np.linspace(0, lengths[-1], size)
+        seconds = measure(lambda: path_frames(points, lengths, distances), repeat)
+        results['curve/%d' % size] = {
+            'seconds': seconds,
+            'per_second': size / seconds
+        }
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns the names of all benchmarks slower than baseline * tolerance.
+    """
+    return [
+        name for name, result in sorted(results.items())
+        if(
+            name in baseline and
+            result['seconds'] > baseline[name]['seconds'] * tolerance
+        )
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description = "Benchmark the Alignment Tool core.")
+    parser.add_argument("--output", default = "benchmark.json", help = "JSON file for the results")
+    parser.add_argument("--baseline", help = "JSON file with earlier results to compare with")
+    parser.add_argument("--tolerance", type = float, default = 1.25, help = "allowed slowdown factor")
+    parser.add_argument("--repeat", type = int, default = 5, help = "number of measurements per benchmark")
+    parser.add_argument("--quick", action = 'store_true', help = "only the small sizes")
+    args = parser.parse_args(argv)
+
+    sizes = [1, 10, 100, 1000] if args.quick else [1, 10, 100, 1000, 10000, 100000]
+    profiles = [8, 64] if args.quick else [8, 64, 512, 4096]
+
+    results = {}
+    results.update(bench_frames(sizes, args.repeat))
+    results.update(bench_plane([1000, 100000] if args.quick else [1000, 100000, 1000000], args.repeat))
+    results.update(bench_angles(profiles, args.repeat))
+    results.update(bench_sweep([10, 100] if args.quick else [10, 100, 1000], args.repeat))
+    results.update(bench_hashing([1000, 10000] if args.quick else [1000, 10000, 100000, 1000000], args.repeat))
+    results.update(bench_curve(sizes, args.repeat))
+
+    for name, result in sorted(results.items()):
+        print('%-16s %12.3f us %14.0f /s' % (name, result['seconds'] * 1e6, result['per_second']))
+
+    with open(args.output, 'w') as file:
+        json.dump({
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'results': results
+        }, file, indent=2)
+
+    if(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+        slower = compare(results, baseline, args.tolerance)
+        for name in slower:
+            print('REGRESSION %s: %.3f us (baseline %.3f us)' % (
+                name, results[name]['seconds'] * 1e6, baseline[name]['seconds'] * 1e6
+            ))
+        if(slower):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
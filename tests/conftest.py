@@ -0,0 +1,14 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#              Tests              #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+"""
+The tests run on plain CPython against alignment_tool.core (NumPy only).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
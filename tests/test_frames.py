@@ -0,0 +1,100 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#          Tests: Frames          #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+import math
+import numpy as np
+import pytest
+
+from alignment_tool.core import orientation_matrices, matrix_eulers
+
+# # # # # # # # # # # # # # # # # #
+#             Helpers             #
+# # # # # # # # # # # # # # # # # #
+
+def cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def sub(a, b):
+    return tuple(x - y for x, y in zip(a, b))
+
+
+def normalized(v):
+    # Like Vector.normalize(), zero vectors stay zero
+    length = math.sqrt(sum(x * x for x in v))
+    return tuple(x / length for x in v) if length else v
+
+
+def legacy_matrix(start, center, end, inverse=False):
+    """
+    The orientation matrix as the mathutils code of AlignToVerticesOperator
+    computed it before the vectorization, one triple at a time.
+    """
+    if(inverse):
+        start, end = end, start
+    coord_y = cross(sub(start, center), sub(end, center))
+    coord_x = cross(coord_y, sub(end, center))
+    vector_x = normalized(coord_x)
+    vector_y = normalized(coord_y)
+    vector_z = normalized(sub(end, center))
+    return [[vector_x[i], vector_y[i], vector_z[i]] for i in range(3)]
+
+
+def euler_matrix(angles):
+    x, y, z = angles
+    rx = np.array([[1, 0, 0], [0, math.cos(x), -math.sin(x)], [0, math.sin(x), math.cos(x)]])
+    ry = np.array([[math.cos(y), 0, math.sin(y)], [0, 1, 0], [-math.sin(y), 0, math.cos(y)]])
+    rz = np.array([[math.cos(z), -math.sin(z), 0], [math.sin(z), math.cos(z), 0], [0, 0, 1]])
+    return rz @ ry @ rx
+
+# # # # # # # # # # # # # # # # # #
+#              Tests              #
+# # # # # # # # # # # # # # # # # #
+
+def test_orientation_matrix_of_right_angle():
+    matrix = orientation_matrices([[[1, 0, 0], [0, 0, 0], [0, 0, 1]]])[0]
+    assert np.allclose(matrix, [[-1, 0, 0], [0, -1, 0], [0, 0, 1]])
+
+
+@pytest.mark.parametrize('inverse', [False, True])
+def test_orientation_matrices_match_legacy(inverse):
+    triples = np.random.default_rng(1).uniform(-10, 10, (200, 3, 3))
+    expected = [legacy_matrix(*triple, inverse) for triple in triples.tolist()]
+    assert np.allclose(orientation_matrices(triples, inverse), expected, atol=1e-12)
+
+
+def test_orientation_matrices_inverse_per_row():
+    triples = np.random.default_rng(2).uniform(-1, 1, (50, 3, 3))
+    inverse = np.arange(50) % 2 == 1
+    expected = [legacy_matrix(*triple, flag) for triple, flag in zip(triples.tolist(), inverse)]
+    assert np.allclose(orientation_matrices(triples, inverse), expected, atol=1e-12)
+
+
+def test_orientation_matrices_keep_degenerate_axes_zero():
+    # Collinear vertices have no Y-axis, mathutils left it zero
+    triples = [[[0, 0, 0], [1, 0, 0], [2, 0, 0]], [[1, 1, 1], [1, 1, 1], [1, 1, 1]]]
+    matrices = orientation_matrices(triples)
+    assert np.all(np.isfinite(matrices))
+    assert np.allclose(matrices, [legacy_matrix(*triple) for triple in triples])
+
+
+def test_matrix_eulers_round_trip():
+    rng = np.random.default_rng(3)
+    angles = np.column_stack((
+        rng.uniform(-math.pi, math.pi, 500),
+        rng.uniform(-math.pi / 2 + 1e-3, math.pi / 2 - 1e-3, 500),
+        rng.uniform(-math.pi, math.pi, 500)
+    ))
+    matrices = np.array([euler_matrix(a) for a in angles])
+    assert np.allclose(matrix_eulers(matrices), angles, atol=1e-9)
+
+
+@pytest.mark.parametrize('angle_y', [math.pi / 2, -math.pi / 2])
+def test_matrix_eulers_gimbal_lock(angle_y):
+    matrix = euler_matrix((0.7, angle_y, -0.4))
+    angles = matrix_eulers(matrix[None])[0]
+    assert angles[2] == 0
+    assert np.allclose(euler_matrix(angles), matrix, atol=1e-9)
@@ -0,0 +1,85 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#         Tests: Geometry         #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+import math
+from collections import Counter
+import numpy as np
+import pytest
+
+from alignment_tool.core import mitre_geometry, polyline_profile, sweep_geometry
+
+# # # # # # # # # # # # # # # # # #
+#             Helpers             #
+# # # # # # # # # # # # # # # # # #
+
+def circle_profile(count, offset=0.0):
+    t = np.linspace(0, 2 * math.pi, count, endpoint=False)
+    points = np.column_stack((np.cos(t) + offset, np.sin(t), np.zeros(count)))
+    return polyline_profile([(points, True)], True)
+
+
+def square_profile():
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 0.5, 0.0], [0.0, 0.5, 0.0]])
+    return polyline_profile([(points, True)], True)
+
+
+def assert_closed_manifold(vertices, faces):
+    """
+    Every edge is used by exactly two faces in opposite directions, so the
+    mesh is closed and consistently oriented, and its volume is positive.
+    """
+    assert len(faces) > 0
+    edges = Counter((f[k - 1], f[k]) for f in faces for k in range(len(f)))
+    assert all(count == 1 for count in edges.values())
+    assert all((b, a) in edges for a, b in edges)
+    assert all(len(set(f)) == len(f) for f in faces)
+    used = np.unique(np.concatenate(faces))
+    assert np.array_equal(used, np.arange(len(vertices)))
+
+    # Divergence theorem over a fan of every face
+    volume = 0.0
+    for f in faces:
+        for k in range(1, len(f) - 1):
+            volume += np.dot(vertices[f[0]], np.cross(vertices[f[k]], vertices[f[k + 1]])) / 6
+    assert volume > 0
+
+# # # # # # # # # # # # # # # # # #
+#              Tests              #
+# # # # # # # # # # # # # # # # # #
+
+@pytest.mark.parametrize('angle', [math.pi / 6, math.pi / 2, 2 * math.pi / 3, 3 * math.pi / 4])
+@pytest.mark.parametrize('profile', [square_profile(), circle_profile(32, 2.0), circle_profile(16, -2.0)])
+def test_mitre_geometry_is_closed_manifold(profile, angle):
+    vertices, faces = mitre_geometry(*profile, angle)
+    assert_closed_manifold(vertices, faces)
+
+
+def test_mitre_geometry_legs_meet_on_mitre_plane():
+    angle = math.pi / 3
+    coords, faces, edges = square_profile()
+    vertices, polygons = mitre_geometry(coords, faces, edges, angle)
+    normal = np.array([math.cos(angle / 2), 0.0, math.sin(angle / 2)])
+    mitre = np.abs(vertices @ normal) < 1e-9
+    assert mitre.sum() == len(coords)
+
+
+@pytest.mark.parametrize('cyclic', [False, True])
+def test_sweep_geometry_is_closed_manifold(cyclic):
+    t = np.linspace(0, 2 * math.pi, 12, endpoint=False)
+    points = np.column_stack((np.cos(t), np.sin(t), 0.3 * np.sin(2 * t))) * 10
+    vertices, faces = sweep_geometry(*circle_profile(16), points, cyclic)
+    assert_closed_manifold(vertices, faces)
+
+
+def test_sweep_geometry_of_straight_path_has_profile_volume():
+    points = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 2.0], [0.0, 0.0, 5.0]])
+    vertices, faces = sweep_geometry(*square_profile(), points)
+    assert_closed_manifold(vertices, faces)
+    volume = sum(
+        np.dot(vertices[f[0]], np.cross(vertices[f[k]], vertices[f[k + 1]])) / 6
+        for f in faces for k in range(1, len(f) - 1)
+    )
+    assert volume == pytest.approx(0.5 * 5.0)
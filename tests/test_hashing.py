@@ -0,0 +1,68 @@
+# # # # # # # # # # # # # # # # # #
+#         Alignment Tool          #
+#         Tests: Hashing          #
+#        by Florian Otten         #
+# # # # # # # # # # # # # # # # # #
+
+import numpy as np
+import pytest
+
+from alignment_tool.core import triple_index, triple_signatures, find_triples
+
+# # # # # # # # # # # # # # # # # #
+#             Helpers             #
+# # # # # # # # # # # # # # # # # #
+
+def random_mesh(seed, count=300):
+    rng = np.random.default_rng(seed)
+    coords = rng.uniform(0, 1, (count, 3))
+    edges = rng.integers(0, count, (3 * count, 2))
+    return coords, edges[edges[:, 0] != edges[:, 1]]
+
+
+def contains(found, triple):
+    return bool(np.any(np.all(found == triple, axis=1)))
+
+# # # # # # # # # # # # # # # # # #
+#              Tests              #
+# # # # # # # # # # # # # # # # # #
+
+@pytest.mark.parametrize('epsilon', [1e-3, 1e-2])
+def test_find_triples_within_tolerance(epsilon):
+    coords, edges = random_mesh(4)
+    index = triple_index(coords, edges, epsilon, epsilon)
+    rng = np.random.default_rng(5)
+    for triple in index['triples'][:500]:
+        signature = triple_signatures(coords[triple])[0]
+        shift = rng.uniform(-0.999, 0.999, 3) * epsilon
+        assert contains(find_triples(index, signature + shift), triple)
+
+
+def test_find_triples_at_bucket_borders():
+    coords, edges = random_mesh(6)
+    epsilon = 1e-2
+    index = triple_index(coords, edges, epsilon, epsilon)
+    for triple in index['triples'][:200]:
+        signature = triple_signatures(coords[triple])[0]
+        for sign in (-1, 1):
+            assert contains(find_triples(index, signature + sign * 0.999 * epsilon), triple)
+
+
+def test_find_triples_outside_tolerance():
+    coords, edges = random_mesh(7)
+    epsilon = 1e-3
+    index = triple_index(coords, edges, epsilon, epsilon)
+    for triple in index['triples'][:200]:
+        signature = triple_signatures(coords[triple])[0]
+        found = find_triples(index, signature + [1.01 * epsilon, 0, 0])
+        assert not contains(found, triple)
+
+
+def test_find_triples_after_rigid_motion():
+    coords, edges = random_mesh(8)
+    index = triple_index(coords, edges)
+    angle = 0.8
+    rotation = np.array([[np.cos(angle), -np.sin(angle), 0], [np.sin(angle), np.cos(angle), 0], [0, 0, 1]])
+    moved = coords @ rotation.T + [3, -2, 5]
+    for triple in index['triples'][:100]:
+        assert contains(find_triples(index, triple_signatures(moved[triple])[0]), triple)